@@ -6,12 +6,77 @@ Supports 50+ languages including German, English, French, Italian, Spanish
 """
 
 import torch
-from transformers import MBartForConditionalGeneration, MBart50Tokenizer
+from transformers import AutoModelForSeq2SeqLM, MBartForConditionalGeneration, MBart50Tokenizer
 from pathlib import Path
+import json
 import logging
+import re
+import time
+
+from quantization import (
+    BF16_WEIGHTS_FILE,
+    bf16_dir_for,
+    cpu_supports_bf16,
+    load_quantized,
+    quantize_dynamic_int8,
+    quantized_dir_for,
+    read_quantization_info,
+    save_bf16,
+    save_quantized,
+)
+from batching import length_buckets
+from model_utils import source_signature
+from result_cache import ResultCache, make_key, normalize_text
 
 logger = logging.getLogger(__name__)
 
+# Supported model precisions (int8 = dynamic quantization of Linear layers, CPU only)
+PRECISIONS = ('fp32', 'int8', 'bf16')
+
+# Generation parameters for topic labels (part of the label cache key)
+LABEL_GENERATION_KWARGS = {
+    'max_length': 10,  # Much shorter - only 1-3 words
+    'min_length': 1,
+    'no_repeat_ngram_size': 2,
+    'repetition_penalty': 2.0,  # Avoid repetition
+}
+
+# Decoding strategies for topic labels ('auto' = greedy, beam4 only for failed labels)
+LABEL_DECODING_STRATEGIES = {
+    'greedy': {'num_beams': 1},
+    'beam2': {'num_beams': 2, 'length_penalty': 0.3, 'early_stopping': True},
+    'beam4': {'num_beams': 4, 'length_penalty': 0.3, 'early_stopping': True},  # Strongly favor shorter outputs
+}
+LABEL_DECODING_CHOICES = ('auto',) + tuple(LABEL_DECODING_STRATEGIES)
+
+# Number of BERTopic keywords that identify a topic in the label cache
+LABEL_CACHE_KEYWORDS = 10
+
+# Stopwords removed from BERTopic keywords (prompt) and from mBART output (label)
+LABEL_STOPWORDS = {
+    # English stopwords
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were',
+    'our', 'my', 'your', 'their', 'his', 'her',
+    'will', 'would', 'could', 'should',
+    'this', 'that', 'these', 'those', 'it', 'its',
+    # German stopwords (safety - shouldn't occur with forced English output)
+    'der', 'die', 'das', 'den', 'dem', 'des',
+    'ein', 'eine', 'einen', 'einem', 'einer',
+    'und', 'oder', 'aber', 'als', 'auch',
+    'bei', 'von', 'zu', 'mit', 'nach', 'für',
+    'auf', 'um', 'durch', 'über',
+    'es', 'sich', 'wird', 'werden',
+    # Company-specific
+    'ubs'
+}
+
+
+def split_sentences(text: str, min_length: int = 20) -> list:
+    """Split text into sentences (on . ! ?), dropping very short fragments"""
+    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+    return [s.strip() for s in sentences if len(s.strip()) > min_length]
+
 
 class AbstractiveSummarizer:
     """
@@ -19,19 +84,41 @@ class AbstractiveSummarizer:
     Generates new, concise summary text from articles.
     """
 
-    def __init__(self, model_path: str = None):
+    def __init__(self, model_path: str = None, label_cache_path: str = None, label_cache_size: int = 10000,
+                 precision: str = 'fp32', prompt_token_budget: int = None, label_decoding: str = 'beam4',
+                 max_batch_tokens: int = 16384):
         """
         Initialize abstractive summarizer.
 
         Args:
             model_path: Path to local mBART model directory
+            label_cache_path: SQLite file for the persistent topic label cache (None = disabled)
+            label_cache_size: Maximum number of cached labels (LRU eviction)
+            precision: 'fp32', 'int8' (dynamic quantization, CPU) or 'bf16' (CPUs with native
+                       bfloat16 support); converted weights are cached next to the model
+            prompt_token_budget: Token budget for the document part of topic label prompts; the
+                                 most central sentences are added until it is reached
+                                 (None = first 1000 characters of up to 3 documents)
+            label_decoding: Topic label decoding: 'greedy', 'beam2', 'beam4' or 'auto'
+                            (greedy first, beam4 only for labels that fail the length/empty checks)
+            max_batch_tokens: Upper bound for padded tokens × beams per generate() call
+                              (limits batch memory; long inputs get smaller batches)
         """
+        if precision not in PRECISIONS:
+            raise ValueError(f"precision must be one of {PRECISIONS}, got '{precision}'")
+        if label_decoding not in LABEL_DECODING_CHOICES:
+            raise ValueError(f"label_decoding must be one of {LABEL_DECODING_CHOICES}, got '{label_decoding}'")
+        self.label_decoding = label_decoding
+        self.max_batch_tokens = max_batch_tokens
+        self.decoding_stats = {'labels': 0, 'escalated': 0}
+
         if model_path is None:
             # Default path
             base_dir = Path(__file__).parent
             model_path = base_dir / "models" / "mbart-large-50"
 
         self.model_path = Path(model_path)
+        self.prompt_token_budget = prompt_token_budget
 
         if not self.model_path.exists():
             raise FileNotFoundError(
@@ -39,17 +126,79 @@ class AbstractiveSummarizer:
                 "Download with: python setup/download_mbart_model.py"
             )
 
-        logger.info(f"Loading mBART model from {self.model_path}...")
+        logger.info(f"Loading mBART model from {self.model_path} ({precision})...")
+
+        # Set device (GPU if available, int8 kernels are CPU only)
+        self.device = "cuda" if torch.cuda.is_available() and precision != 'int8' else "cpu"
 
         # Load tokenizer and model
         self.tokenizer = MBart50Tokenizer.from_pretrained(str(self.model_path))
-        self.model = MBartForConditionalGeneration.from_pretrained(str(self.model_path))
-
-        # Set device (GPU if available)
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.model, self.precision = self._load_model(precision)
         self.model.to(self.device)
+        self.model.eval()
+
+        logger.info(f"   ✓ Model loaded on {self.device} ({self.precision})")
+
+        # Model identity for label cache keys (path + weight files + precision)
+        self.model_id = make_key(
+            str(self.model_path.resolve()),
+            json.dumps(source_signature(self.model_path), sort_keys=True),
+            self.precision
+        )
+
+        self.label_cache = None
+        if label_cache_path:
+            self.label_cache = ResultCache(label_cache_path, max_entries=label_cache_size)
+            logger.info(f"   💾 Label-Cache: {label_cache_path} ({len(self.label_cache)} Einträge)")
+
+    def _load_model(self, precision: str):
+        """
+        Load mBART in the requested precision.
+
+        int8 and bf16 weights are converted once and cached next to the
+        original model (e.g. models/mbart-large-50-int8/); the cache is
+        rebuilt when the original weights change.
+
+        Returns:
+            Tuple of (model, precision actually used)
+        """
+        if precision == 'bf16' and self.device == "cpu" and not cpu_supports_bf16():
+            logger.warning("   ⚠️  CPU has no native bfloat16 support → using fp32")
+            precision = 'fp32'
+
+        if precision == 'fp32':
+            return MBartForConditionalGeneration.from_pretrained(str(self.model_path)), precision
 
-        logger.info(f"   ✓ Model loaded on {self.device}")
+        signature = source_signature(self.model_path)
+        if precision == 'int8':
+            target_dir = quantized_dir_for(self.model_path)
+            info = read_quantization_info(target_dir)
+        else:
+            target_dir = bf16_dir_for(self.model_path)
+            info = read_quantization_info(target_dir, weights_file=BF16_WEIGHTS_FILE)
+
+        if info is not None and info.get('source_signature') == signature:
+            if precision == 'int8':
+                return load_quantized(AutoModelForSeq2SeqLM, self.model_path, target_dir), precision
+            return MBartForConditionalGeneration.from_pretrained(str(target_dir), torch_dtype=torch.bfloat16), precision
+
+        logger.info(f"   Converting mBART to {precision} (once) → {target_dir}")
+        start = time.time()
+        model = MBartForConditionalGeneration.from_pretrained(str(self.model_path))
+        info = {
+            'source_model': self.model_path.name,
+            'source_signature': signature,
+            'dtype': 'qint8' if precision == 'int8' else 'bfloat16',
+        }
+        if precision == 'int8':
+            model = quantize_dynamic_int8(model)
+            info['quantized_modules'] = ['Linear']
+            info['convert_seconds'] = round(time.time() - start, 3)
+            save_quantized(model, target_dir, info)
+        else:
+            info['convert_seconds'] = round(time.time() - start, 3)
+            save_bf16(model, target_dir, info)
+        return model, precision
 
     def summarize(
         self,
@@ -76,63 +225,90 @@ class AbstractiveSummarizer:
         Returns:
             Generated summary text
         """
-        if not text or not text.strip():
-            return ""
-
-        # Truncate input if too long (mBART has 1024 token limit)
-        max_input_tokens = 1024
-        inputs = self.tokenizer(
-            text,
-            max_length=max_input_tokens,
-            truncation=True,
-            return_tensors="pt"
-        )
-        inputs = inputs.to(self.device)
-
-        # Set source language
-        self.tokenizer.src_lang = source_lang
-
-        # Generate summary
-        summary_ids = self.model.generate(
-            inputs["input_ids"],
+        return self.summarize_batch(
+            [text],
+            source_lang=source_lang,
             max_length=max_length,
             min_length=min_length,
             num_beams=num_beams,
             length_penalty=length_penalty,
-            early_stopping=early_stopping,
-            forced_bos_token_id=self.tokenizer.lang_code_to_id[source_lang]
-        )
-
-        # Decode summary
-        summary = self.tokenizer.decode(
-            summary_ids[0],
-            skip_special_tokens=True,
-            clean_up_tokenization_spaces=True
-        )
-
-        return summary.strip()
+            early_stopping=early_stopping
+        )[0]
 
     def summarize_batch(
         self,
         texts: list,
         source_lang: str = "de_DE",
-        **kwargs
+        max_length: int = 150,
+        min_length: int = 40,
+        num_beams: int = 4,
+        length_penalty: float = 2.0,
+        early_stopping: bool = True,
+        batch_size: int = 8
     ) -> list:
         """
-        Summarize multiple texts in batch.
+        Summarize multiple texts in batches.
+
+        All texts are tokenized once, sorted by token length and grouped into
+        batches (see batching.length_buckets), so short texts are not padded to the
+        longest one. Each batch is one generate() call with attention mask.
 
         Args:
             texts: List of texts to summarize
-            source_lang: Source language code
-            **kwargs: Additional arguments for summarize()
+            source_lang: Source language code (same for all texts)
+            max_length: Maximum summary length in tokens
+            min_length: Minimum summary length in tokens
+            num_beams: Number of beams for beam search
+            length_penalty: Length penalty (>1.0 favors longer summaries)
+            early_stopping: Stop when num_beams sentences are done
+            batch_size: Maximum number of texts per generate() call
 
         Returns:
-            List of summaries
+            List of summaries in the same order as texts ("" for empty texts)
         """
-        summaries = []
-        for text in texts:
-            summary = self.summarize(text, source_lang=source_lang, **kwargs)
-            summaries.append(summary)
+        summaries = [""] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return summaries
+
+        # src_lang must be set BEFORE tokenizing, it selects the language prefix token
+        self.tokenizer.src_lang = source_lang
+
+        # Truncate input if too long (mBART has 1024 token limit)
+        max_input_tokens = 1024
+        encoded = self.tokenizer(
+            [texts[i] for i in indices],
+            max_length=max_input_tokens,
+            truncation=True
+        )["input_ids"]
+
+        # Beam search multiplies the working set → lengths × beams against the token budget
+        for batch in length_buckets([len(ids) * num_beams for ids in encoded], batch_size, self.max_batch_tokens):
+            inputs = self.tokenizer.pad({"input_ids": [encoded[j] for j in batch]}, return_tensors="pt")
+            inputs = inputs.to(self.device)
+
+            # Generate summary
+            with torch.inference_mode():
+                summary_ids = self.model.generate(
+                    inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
+                    max_length=max_length,
+                    min_length=min_length,
+                    num_beams=num_beams,
+                    length_penalty=length_penalty,
+                    early_stopping=early_stopping,
+                    forced_bos_token_id=self.tokenizer.lang_code_to_id[source_lang]
+                )
+
+            # Decode summaries
+            decoded = self.tokenizer.batch_decode(
+                summary_ids,
+                skip_special_tokens=True,
+                clean_up_tokenization_spaces=True
+            )
+            for j, summary in zip(batch, decoded):
+                summaries[indices[j]] = summary.strip()
+
         return summaries
 
     def generate_topic_label(
@@ -140,7 +316,8 @@ class AbstractiveSummarizer:
         keywords: list,
         representative_docs: list,
         source_lang: str = "de_DE",
-        max_keywords: int = 3
+        max_keywords: int = 3,
+        central_sentences: list = None
     ) -> str:
         """
         Generate concise topic label (1-3 keywords) from topic keywords and documents.
@@ -150,6 +327,8 @@ class AbstractiveSummarizer:
             representative_docs: List of representative documents for this topic
             source_lang: Source language code
             max_keywords: Maximum number of keywords to return (1-3)
+            central_sentences: Sentences of the representative documents, most central
+                               first (used with prompt_token_budget)
 
         Returns:
             Concise topic label (e.g., "Homeoffice", "KI & Automatisierung", "Nachhaltigkeit")
@@ -164,46 +343,207 @@ class AbstractiveSummarizer:
             print("   → Returning 'Sonstiges' (no keywords/docs)")
             return "Sonstiges"
 
-        # Define stopwords FIRST (before using them)
-        stopwords = {
-            # English stopwords
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were',
-            'our', 'my', 'your', 'their', 'his', 'her',
-            'will', 'would', 'could', 'should',
-            'this', 'that', 'these', 'those', 'it', 'its',
-            # German stopwords (safety - shouldn't occur with forced English output)
-            'der', 'die', 'das', 'den', 'dem', 'des',
-            'ein', 'eine', 'einen', 'einem', 'einer',
-            'und', 'oder', 'aber', 'als', 'auch',
-            'bei', 'von', 'zu', 'mit', 'nach', 'für',
-            'auf', 'um', 'durch', 'über',
-            'es', 'sich', 'wird', 'werden',
-            # Company-specific
-            'ubs'
-        }
+        cache_key = None
+        if self.label_cache is not None:
+            cache_key = self._label_cache_key(
+                keywords, representative_docs, source_lang, max_keywords, central_sentences
+            )
+            cached = self.label_cache.get(cache_key)
+            if cached is not None:
+                print(f"   → Cached label: '{cached['label']}'")
+                return cached['label']
+
+        prompt = self._build_label_prompt(keywords, representative_docs, central_sentences, verbose=True)
+
+        # Debug: Show the prompt (truncated for readability)
+        prompt_preview = prompt[:500] + "..." if len(prompt) > 500 else prompt
+        print(f"   📝 Prompt preview (first 500 chars):\n{prompt_preview}\n")
+        print(f"   Total prompt length: {len(prompt)} characters (~{len(prompt)//4} tokens)")
+
+        raw_labels, failed = self._decode_labels(self._encode_prompts([prompt], source_lang), max_keywords)
+        if failed:
+            raise failed[0]
+        raw_label = raw_labels[0]
+        label = self._postprocess_label(raw_label, keywords, max_keywords, verbose=True)
+
+        if cache_key is not None:
+            self.label_cache.put(cache_key, {'label': label})
+        return label
+
+    def generate_topic_labels_batch(
+        self,
+        topics: list,
+        source_lang: str = "de_DE",
+        max_keywords: int = 3,
+        batch_size: int = 8,
+        central_sentences: list = None
+    ) -> list:
+        """
+        Generate topic labels for many topics with batched mBART calls.
 
+        All prompts are built first, sorted by token length and generated in
+        batches with dynamic padding (one encoder pass + beam search per batch
+        instead of per topic). Post-processing and fallbacks are the same as
+        in generate_topic_label(). Topics found in the label cache are not
+        sent to mBART at all. If a batch fails (e.g. out of memory), only its
+        topics get keyword labels; those labels are not cached.
+
+        Args:
+            topics: List of (keywords, representative_docs) tuples, one per topic
+            source_lang: Source language code
+            max_keywords: Maximum number of keywords per label (1-3)
+            batch_size: Number of prompts per generate() call
+            central_sentences: Optional list (one entry per topic) of sentences of the
+                               representative documents, most central first
+
+        Returns:
+            List of labels in the same order as topics
+        """
+        labels = [None] * len(topics)
+        if central_sentences is None:
+            central_sentences = [None] * len(topics)
+
+        cache_keys = {}
+        cached = {}
+        if self.label_cache is not None:
+            cache_keys = {
+                index: self._label_cache_key(
+                    keywords, representative_docs, source_lang, max_keywords, central_sentences[index]
+                )
+                for index, (keywords, representative_docs) in enumerate(topics)
+                if keywords or representative_docs
+            }
+            cached = self.label_cache.get_many(list(cache_keys.values()))
+
+        indices = []
+        prompts = []
+        for index, (keywords, representative_docs) in enumerate(topics):
+            if not keywords and not representative_docs:
+                labels[index] = "Sonstiges"
+            elif cache_keys.get(index) in cached:
+                labels[index] = cached[cache_keys[index]]['label']
+            else:
+                indices.append(index)
+                prompts.append(self._build_label_prompt(keywords, representative_docs, central_sentences[index]))
+
+        if cached:
+            logger.info(f"   💾 {len(topics) - len(prompts)} Topic-Labels aus dem Label-Cache")
+        if not prompts:
+            return labels
+
+        encoded = self._encode_prompts(prompts, source_lang)
+        raw_labels, failed = self._decode_labels(encoded, max_keywords, batch_size)
+        for i, raw_label in enumerate(raw_labels):
+            keywords = topics[indices[i]][0]
+            # Failed batch → empty output → keyword fallback of _postprocess_label
+            labels[indices[i]] = self._postprocess_label(raw_label or "", keywords, max_keywords)
+
+        if self.label_cache is not None:
+            self.label_cache.put_many({
+                cache_keys[index]: {'label': labels[index]}
+                for i, index in enumerate(indices) if i not in failed
+            })
+
+        logger.info(
+            f"   ✓ {len(prompts) - len(failed)} Topic-Labels generiert (batch_size={batch_size}, decoding={self.label_decoding}, "
+            f"{self.decoding_stats['escalated']}/{self.decoding_stats['labels']} mit Beam Search nachgeneriert)"
+        )
+        if failed:
+            logger.warning(f"   ⚠️  {len(failed)} Topic-Labels aus Keywords (mBART-Batch fehlgeschlagen, nicht gecacht)")
+        return labels
+
+    def _label_cache_key(self, keywords: list, representative_docs: list, source_lang: str, max_keywords: int,
+                         central_sentences: list = None) -> str:
+        """
+        Cache key of a topic label.
+
+        Built from the model identity, the normalized top keywords (without
+        scores), a hash of each representative document (and of the sentence
+        ranking, if given) and the generation parameters. Unchanged topics in
+        the next run hit the same key.
+        """
+        keyword_text = '\x1f'.join(
+            normalize_text(word).lower() for word, _ in keywords[:LABEL_CACHE_KEYWORDS]
+        )
+        doc_hashes = [make_key(normalize_text(doc)) for doc in (representative_docs or [])[:3]]
+        if self.prompt_token_budget and central_sentences:
+            doc_hashes.append(make_key(*(normalize_text(sentence) for sentence in central_sentences)))
+        params = json.dumps(
+            {
+                **LABEL_GENERATION_KWARGS,
+                'source_lang': source_lang,
+                'max_keywords': max_keywords,
+                'prompt_token_budget': self.prompt_token_budget,
+                'decoding': self.label_decoding,
+                'decoding_kwargs': LABEL_DECODING_STRATEGIES,
+            },
+            sort_keys=True
+        )
+        return make_key(self.model_id, keyword_text, *doc_hashes, params)
+
+    def get_label_cache_stats(self) -> dict:
+        """Returns label cache statistics (None if the cache is disabled)"""
+        return self.label_cache.get_stats() if self.label_cache is not None else None
+
+    def close(self):
+        """Closes the label cache"""
+        if self.label_cache is not None:
+            self.label_cache.close()
+            self.label_cache = None
+
+    def _build_label_prompt(self, keywords: list, representative_docs: list, central_sentences: list = None,
+                            verbose: bool = False) -> str:
+        """
+        Build the mBART prompt from keywords and representative documents.
+
+        Args:
+            keywords: List of (word, score) tuples from BERTopic
+            representative_docs: List of representative documents for this topic
+            central_sentences: Sentences ranked by centrality (used with prompt_token_budget)
+            verbose: Print debug output
+
+        Returns:
+            Prompt text
+        """
         # Filter stopwords from BERTopic keywords BEFORE sending to mBART
         # This prevents mBART from seeing stopwords in the input
-        filtered_keywords = [(word, score) for word, score in keywords if word.lower() not in stopwords]
+        filtered_keywords = [(word, score) for word, score in keywords if word.lower() not in LABEL_STOPWORDS]
 
         # If all keywords were stopwords, use original keywords (fallback)
         if not filtered_keywords:
-            print("   ⚠️  All keywords were stopwords! Using original keywords.")
+            if verbose:
+                print("   ⚠️  All keywords were stopwords! Using original keywords.")
             filtered_keywords = keywords
 
         # Take top 5 filtered keywords
         top_keywords = [word for word, _ in filtered_keywords[:5]]
         keyword_text = ", ".join(top_keywords)
 
-        print(f"   Filtered keywords (stopwords removed): {top_keywords}")
+        if verbose:
+            print(f"   Filtered keywords (stopwords removed): {top_keywords}")
 
         # Build prompt with representative documents for better context
         # Use first 1000 characters from each of the top 3 representative docs
         # This gives mBART real context instead of just keywords
         prompt_parts = []
 
-        if representative_docs and len(representative_docs) > 0:
+        if self.prompt_token_budget and representative_docs:
+            # Encoder cost grows quadratically with length: only the most central
+            # sentences that fit into the token budget
+            if not central_sentences:
+                central_sentences = [
+                    sentence for doc in representative_docs[:3] for sentence in split_sentences(doc)
+                ]
+            selected = self._select_sentences(central_sentences, self.prompt_token_budget)
+            if selected:
+                prompt_parts.append("Representative sentences for this topic:\n")
+                for sentence in selected:
+                    prompt_parts.append(f"- {sentence}\n")
+                prompt_parts.append("\n")
+            prompt_parts.append(f"Keywords: {keyword_text}\n")
+            if verbose:
+                print(f"   Using {len(selected)} central sentences (budget {self.prompt_token_budget} tokens) for context")
+        elif representative_docs and len(representative_docs) > 0:
             prompt_parts.append("Representative documents for this topic:\n")
 
             # Take up to 3 representative docs
@@ -216,64 +556,159 @@ class AbstractiveSummarizer:
                     prompt_parts.append(f"{i}. '{doc_excerpt}...'\n")
 
             prompt_parts.append(f"\nKeywords: {keyword_text}\n")
-            print(f"   Using {min(3, len(representative_docs))} representative docs (1000 chars each) for context")
+            if verbose:
+                print(f"   Using {min(3, len(representative_docs))} representative docs (1000 chars each) for context")
         else:
             # Fallback: just use keywords if no docs available
             prompt_parts.append(f"Keywords: {keyword_text}\n")
-            print(f"   No representative docs available, using keywords only")
+            if verbose:
+                print(f"   No representative docs available, using keywords only")
 
         prompt_parts.append("\nGenerate a concise topic label in English (1-3 words):")
-        prompt = "".join(prompt_parts)
+        return "".join(prompt_parts)
 
-        # Debug: Show the prompt (truncated for readability)
-        prompt_preview = prompt[:500] + "..." if len(prompt) > 500 else prompt
-        print(f"   📝 Prompt preview (first 500 chars):\n{prompt_preview}\n")
-        print(f"   Total prompt length: {len(prompt)} characters (~{len(prompt)//4} tokens)")
+    def _select_sentences(self, ranked_sentences: list, token_budget: int) -> list:
+        """
+        Pick sentences in rank order until the token budget is used up.
 
-        # Generate with mBART
-        # Now with more input tokens (up to 3 docs × 1000 chars ≈ 750 tokens)
-        inputs = self.tokenizer(
-            prompt,
-            max_length=1024,  # Increased to handle 3 docs + keywords
-            truncation=True,
-            return_tensors="pt"
-        )
-        inputs = inputs.to(self.device)
+        Args:
+            ranked_sentences: Sentences, most central first
+            token_budget: Maximum number of tokens for all selected sentences
+
+        Returns:
+            Selected sentences, most central first
+        """
+        ranked_sentences = [' '.join(sentence.split()) for sentence in ranked_sentences if sentence.strip()]
+        if not ranked_sentences:
+            return []
+
+        lengths = [
+            len(ids) for ids in self.tokenizer(ranked_sentences, add_special_tokens=False)["input_ids"]
+        ]
+        selected = []
+        used = 0
+        for rank, length in enumerate(lengths):
+            if used + length > token_budget:
+                continue
+            selected.append(rank)
+            used += length
+
+        return [ranked_sentences[rank] for rank in selected]
+
+    def _encode_prompts(self, prompts: list, source_lang: str) -> list:
+        """
+        Tokenize prompts without padding (token ids per prompt).
 
+        Args:
+            prompts: Prompt texts
+            source_lang: Source language code
+
+        Returns:
+            List of token id lists (truncated to 1024 tokens)
+        """
         # IMPORTANT: Accept input in source_lang (could be de_DE, en_XX, etc.)
-        # But FORCE output to English via forced_bos_token_id
-        self.tokenizer.src_lang = source_lang  # Accept any input language
+        # src_lang must be set BEFORE tokenizing, it selects the language prefix token
+        self.tokenizer.src_lang = source_lang
+
+        # Up to 3 docs × 1000 chars ≈ 750 tokens
+        return self.tokenizer(prompts, max_length=1024, truncation=True)["input_ids"]
+
+    def _decode_labels(self, encoded: list, max_keywords: int, batch_size: int = 8) -> tuple:
+        """
+        Generate raw labels for tokenized prompts with the configured decoding strategy.
+
+        Prompts are grouped by token length (see batching.length_buckets) so each
+        batch pads to similar lengths. With 'auto', all prompts are decoded greedily first; only
+        labels that would trigger the keyword fallback (empty or too long)
+        are generated again with 4-beam search.
+
+        Args:
+            encoded: Token ids per prompt
+            max_keywords: Maximum number of keywords (for the fallback check)
+            batch_size: Number of prompts per generate() call
+
+        A batch that raises (e.g. out of memory) only affects its own prompts:
+        they are reported in the returned failures and the other batches
+        continue. A failed beam4 retry keeps the greedy output.
+
+        Returns:
+            Tuple of (raw labels in the same order as encoded, None for failed prompts;
+            dict prompt index → exception for prompts whose generation failed)
+        """
+        def run(indices, strategy):
+            indices = list(indices)
+            num_beams = LABEL_DECODING_STRATEGIES[strategy]['num_beams']
+            for bucket in length_buckets([len(encoded[i]) * num_beams for i in indices], batch_size, self.max_batch_tokens):
+                batch = [indices[j] for j in bucket]
+                try:
+                    batch_labels = self._generate_raw_labels([encoded[i] for i in batch], strategy)
+                except Exception as e:
+                    logger.warning(f"   ⚠️  mBART-Batch ({len(batch)} Prompts, {strategy}) fehlgeschlagen: {e}")
+                    failed.update((i, e) for i in batch)
+                    continue
+                for i, raw_label in zip(batch, batch_labels):
+                    raw_labels[i] = raw_label
+
+        raw_labels = [None] * len(encoded)
+        failed = {}
+        first_strategy = 'greedy' if self.label_decoding == 'auto' else self.label_decoding
+        run(range(len(encoded)), first_strategy)
+
+        escalate = []
+        if self.label_decoding == 'auto':
+            escalate = [
+                i for i, raw_label in enumerate(raw_labels)
+                if i not in failed and not self._label_fits(raw_label, max_keywords)
+            ]
+            if escalate:
+                run(escalate, 'beam4')
+
+        self.decoding_stats['labels'] += len(encoded)
+        self.decoding_stats['escalated'] += len(escalate)
+        return raw_labels, failed
+
+    def _generate_raw_labels(self, batch_ids: list, strategy: str = 'beam4') -> list:
+        """
+        Run mBART on one batch of tokenized label prompts.
+
+        Args:
+            batch_ids: Token ids per prompt (padded to the longest prompt in the batch)
+            strategy: Decoding strategy (key of LABEL_DECODING_STRATEGIES)
+
+        Returns:
+            Decoded raw labels (punctuation at the end removed)
+        """
+        inputs = self.tokenizer.pad({"input_ids": batch_ids}, return_tensors="pt")
+        inputs = inputs.to(self.device)
 
         # Generate very short label (max 10 tokens for 1-3 keywords)
         # mBART-large-50 supports 50+ languages for BOTH input and output
         # We accept German/English/etc keywords as input (via source_lang)
         # But ALWAYS generate English output (via forced_bos_token_id)
-        label_ids = self.model.generate(
-            inputs["input_ids"],
-            max_length=10,  # Much shorter - only 1-3 words
-            min_length=1,
-            num_beams=4,
-            length_penalty=0.3,  # Strongly favor shorter outputs
-            early_stopping=True,
-            forced_bos_token_id=self.tokenizer.lang_code_to_id["en_XX"],  # ALWAYS output English
-            no_repeat_ngram_size=2,
-            repetition_penalty=2.0  # Avoid repetition
-        )
+        with torch.inference_mode():
+            label_ids = self.model.generate(
+                inputs["input_ids"],
+                attention_mask=inputs["attention_mask"],
+                forced_bos_token_id=self.tokenizer.lang_code_to_id["en_XX"],  # ALWAYS output English
+                **LABEL_GENERATION_KWARGS,
+                **LABEL_DECODING_STRATEGIES[strategy]
+            )
 
-        # Decode label
-        label = self.tokenizer.decode(
-            label_ids[0],
+        # Decode labels, clean up: Remove punctuation at the end
+        labels = self.tokenizer.batch_decode(
+            label_ids,
             skip_special_tokens=True,
             clean_up_tokenization_spaces=True
         )
+        return [label.strip().rstrip('.,!?;:') for label in labels]
 
-        # Clean up: Remove punctuation at the end
-        raw_label = label.strip().rstrip('.,!?;:')
-
-        # Filter out stopwords from mBART output (reuse stopwords defined earlier)
+    @staticmethod
+    def _clean_label(raw_label: str) -> str:
+        """Remove stopwords from a raw mBART label and convert it to Title Case"""
+        # Filter out stopwords from mBART output
         # This catches any stopwords that mBART generated despite our input filtering
         words = raw_label.split()
-        filtered_words = [w for w in words if w.lower() not in stopwords]
+        filtered_words = [w for w in words if w.lower() not in LABEL_STOPWORDS]
 
         # If filtering removed everything, keep original
         if filtered_words:
@@ -282,29 +717,50 @@ class AbstractiveSummarizer:
             label = raw_label
 
         # Capitalize each word for consistency (Title Case)
-        label = ' '.join(word.capitalize() for word in label.split())
+        return ' '.join(word.capitalize() for word in label.split())
+
+    @classmethod
+    def _label_fits(cls, raw_label: str, max_keywords: int) -> bool:
+        """True if the cleaned label is non-empty and at most max_keywords + 1 words long"""
+        label = cls._clean_label(raw_label)
+        return bool(label) and len(label.split()) <= max_keywords + 1
+
+    def _postprocess_label(self, raw_label: str, keywords: list, max_keywords: int, verbose: bool = False) -> str:
+        """
+        Stopword filtering, Title Case and keyword fallback for a raw mBART label.
+
+        Args:
+            raw_label: Decoded mBART output
+            keywords: List of (word, score) tuples from BERTopic (for the fallback)
+            max_keywords: Maximum number of keywords (label may have one word more)
+            verbose: Print debug output
+
+        Returns:
+            Final topic label
+        """
+        label = self._clean_label(raw_label)
 
         # Show before/after if stopwords were removed
-        print(f"   Raw mBART output: '{raw_label}'")
-        if raw_label != label:
-            print(f"   After stopword removal: '{label}'")
-        print(f"   Word count: {len(label.split())}")
-        print(f"   Max allowed words: {max_keywords + 1}")
+        if verbose:
+            print(f"   Raw mBART output: '{raw_label}'")
+            if raw_label != label:
+                print(f"   After stopword removal: '{label}'")
+            print(f"   Word count: {len(label.split())}")
+            print(f"   Max allowed words: {max_keywords + 1}")
 
         # Fallback: If mBART generates too long or empty, use top keywords
-        if not label:
-            print(f"   ⚠️  Fallback triggered! Output is EMPTY")
-            # Use top keywords as fallback
-            top_words = [word.capitalize() for word, _ in keywords[:max_keywords]]
-            label = " & ".join(top_words) if top_words else "Sonstiges"
-            print(f"   → Fallback label: '{label}'")
-        elif len(label.split()) > max_keywords + 1:
-            print(f"   ⚠️  Fallback triggered! Output too long ({len(label.split())} words > {max_keywords + 1})")
-            print(f"   → Too long output was: '{label}'")
+        if not self._label_fits(raw_label, max_keywords):
+            if verbose:
+                if not label:
+                    print(f"   ⚠️  Fallback triggered! Output is EMPTY")
+                else:
+                    print(f"   ⚠️  Fallback triggered! Output too long ({len(label.split())} words > {max_keywords + 1})")
+                    print(f"   → Too long output was: '{label}'")
             # Use top keywords as fallback
             top_words = [word.capitalize() for word, _ in keywords[:max_keywords]]
             label = " & ".join(top_words) if top_words else "Sonstiges"
-            print(f"   → Fallback label: '{label}'")
+            if verbose:
+                print(f"   → Fallback label: '{label}'")
 
         return label
 
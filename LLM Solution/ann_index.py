@@ -0,0 +1,169 @@
+"""
+Approximate Nearest Neighbour Index (IVF, reines NumPy)
+
+Inverted-File-Index für Cosine-Ähnlichkeit: Die normalisierten Vektoren
+werden per k-means in n_lists Listen aufgeteilt. Eine Suche vergleicht nur
+mit den Vektoren der n_probe nächstgelegenen Listen statt mit allen.
+
+Verwendung:
+- kNN-Graph für UMAP (precomputed_knn), ersetzt die UMAP-interne Suche
+- Suchindex für UMAP.transform (gleiche query()-Schnittstelle wie NNDescent)
+
+Läuft komplett offline auf CPU, keine zusätzlichen Abhängigkeiten.
+"""
+
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Version der gespeicherten Index-Attribute (IVFIndex wird mit UMAP gepickelt,
+# siehe main_bertopic._save_topic_model) - bei Änderungen an den Attributen erhöhen
+IVF_INDEX_VERSION = 1
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-Normalisierung zeilenweise (float32)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class IVFIndex:
+    """
+    IVF-Index für Cosine-Distanz (1 - Cosine-Ähnlichkeit)
+    """
+
+    # UMAP.transform wählt epsilon anhand dieses Attributs (wie bei NNDescent)
+    _angular_trees = True
+
+    def __init__(self, n_lists: Optional[int] = None, n_probe: int = 8, kmeans_iter: int = 10, seed: int = 42):
+        """
+        Initialisiert den Index
+
+        Args:
+            n_lists: Anzahl Listen (None = sqrt(Anzahl Vektoren))
+            n_probe: Anzahl durchsuchter Listen pro Anfrage (höher = genauer, langsamer)
+            kmeans_iter: k-means Iterationen für die Listen-Zentroide
+            seed: Seed für die Zentroid-Initialisierung
+        """
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.kmeans_iter = kmeans_iter
+        self.seed = seed
+
+        self.data = None
+        self.centroids = None
+        self._order = None
+        self._offsets = None
+
+    def fit(self, vectors: np.ndarray) -> 'IVFIndex':
+        """
+        Baut den Index über alle Vektoren
+
+        Args:
+            vectors: Array [n, dim] (z.B. Sentence-Embeddings)
+
+        Returns:
+            self
+        """
+        self.data = _normalize(vectors)
+        n = self.data.shape[0]
+        n_lists = min(self.n_lists or max(1, int(np.sqrt(n))), n)
+
+        # Sphärisches k-means auf einer Stichprobe (max. 256 Vektoren pro Liste)
+        rng = np.random.RandomState(self.seed)
+        sample = self.data[rng.choice(n, size=min(n, 256 * n_lists), replace=False)]
+        centroids = sample[rng.choice(sample.shape[0], size=n_lists, replace=False)]
+        for _ in range(self.kmeans_iter):
+            assignment = (sample @ centroids.T).argmax(axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            empty = np.bincount(assignment, minlength=n_lists) == 0
+            sums[empty] = centroids[empty]
+            centroids = _normalize(sums)
+        self.centroids = centroids
+
+        # Vektoren nach Liste sortieren → jede Liste ist ein zusammenhängender Bereich
+        assignment = self._assign(self.data)
+        self._order = np.argsort(assignment, kind='stable')
+        counts = np.bincount(assignment, minlength=n_lists)
+        self._offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        logger.info(f"IVF-Index: {n} Vektoren in {n_lists} Listen (n_probe={self.n_probe})")
+        return self
+
+    def _assign(self, normalized: np.ndarray, chunk_size: int = 4096) -> np.ndarray:
+        """Nächste Liste für jeden (normalisierten) Vektor"""
+        return np.concatenate([
+            (normalized[start:start + chunk_size] @ self.centroids.T).argmax(axis=1)
+            for start in range(0, normalized.shape[0], chunk_size)
+        ])
+
+    def query(self, queries: np.ndarray, k: int, epsilon: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sucht die k nächsten Nachbarn (Cosine-Distanz)
+
+        Jede Anfrage durchsucht die n_probe Listen, deren Zentroide ihr am
+        ähnlichsten sind. Gerechnet wird pro Liste: alle Anfragen, die eine
+        Liste durchsuchen, werden mit einer einzigen Matrix-Multiplikation
+        gegen deren Vektoren verglichen und in ihre laufenden Top-k gemischt.
+
+        Args:
+            queries: Array [m, dim]
+            k: Anzahl Nachbarn
+            epsilon: Wird ignoriert (Kompatibilität mit UMAP/NNDescent)
+
+        Returns:
+            (indices [m, k] int32, distances [m, k] float32), aufsteigend nach Distanz
+        """
+        queries = _normalize(queries)
+        n_queries = queries.shape[0]
+        k = min(k, self.data.shape[0])
+        best_sims = np.full((n_queries, k), -np.inf, dtype=np.float32)
+        best_ids = np.full((n_queries, k), -1, dtype=np.int64)
+
+        # Invertiert: Liste → Anfragen, die sie durchsuchen
+        probe_lists = self._probe_lists(queries)
+        probe_rows = np.repeat(np.arange(n_queries), probe_lists.shape[1])
+        probe_lists = probe_lists.ravel()
+        by_list = np.argsort(probe_lists, kind='stable')
+        list_ids, list_starts = np.unique(probe_lists[by_list], return_index=True)
+
+        for list_id, rows in zip(list_ids, np.split(probe_rows[by_list], list_starts[1:])):
+            members = self._order[self._offsets[list_id]:self._offsets[list_id + 1]]
+            if len(members) == 0:
+                continue
+            sims = queries[rows] @ self.data[members].T
+            merged_sims = np.concatenate([best_sims[rows], sims], axis=1)
+            merged_ids = np.concatenate([best_ids[rows], np.broadcast_to(members, sims.shape)], axis=1)
+            top = np.argpartition(-merged_sims, k - 1, axis=1)[:, :k]
+            best_sims[rows] = np.take_along_axis(merged_sims, top, axis=1)
+            best_ids[rows] = np.take_along_axis(merged_ids, top, axis=1)
+
+        # Weniger als k Kandidaten in den durchsuchten Listen → exakte Suche für diese Anfragen
+        short = np.where((best_ids < 0).any(axis=1))[0]
+        if len(short):
+            sims = queries[short] @ self.data.T
+            top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            best_sims[short] = np.take_along_axis(sims, top, axis=1)
+            best_ids[short] = top
+
+        ranking = np.argsort(-best_sims, axis=1)
+        indices = np.take_along_axis(best_ids, ranking, axis=1).astype(np.int32)
+        distances = np.maximum(1.0 - np.take_along_axis(best_sims, ranking, axis=1), 0.0)
+        return indices, distances
+
+    def _probe_lists(self, normalized: np.ndarray, chunk_size: int = 4096) -> np.ndarray:
+        """Die n_probe ähnlichsten Listen pro (normalisiertem) Vektor → [m, n_probe]"""
+        n_probe = min(self.n_probe, self.centroids.shape[0])
+        return np.concatenate([
+            np.argpartition(-(normalized[start:start + chunk_size] @ self.centroids.T), n_probe - 1, axis=1)[:, :n_probe]
+            for start in range(0, normalized.shape[0], chunk_size)
+        ])
+
+    def knn_graph(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """kNN-Graph über alle indexierten Vektoren (jeder Vektor ist sein eigener erster Nachbar)"""
+        return self.query(self.data, k)
@@ -0,0 +1,42 @@
+"""
+Längen-Bucketing für Transformer-Batches
+
+Gemeinsam genutzt von OfflineSentimentAnalyzer (Kommentar-Fenster) und
+AbstractiveSummarizer (Summaries, Topic-Label-Prompts).
+"""
+
+from typing import List
+
+
+def length_buckets(lengths: List[int], batch_size: int, max_batch_tokens: int) -> List[List[int]]:
+    """
+    Gruppiert Indizes nach Token-Länge in Batches
+
+    Ein Batch endet, wenn batch_size erreicht ist oder das gepaddete
+    Volumen (Anzahl × längste Sequenz) max_batch_tokens überschreiten würde.
+    Lange Texte landen so in kleinen Batches und zwingen kurze nicht zum Padding.
+
+    Args:
+        lengths: Token-Länge pro Text (bei Beam-Suche × Anzahl Beams)
+        batch_size: Maximale Anzahl Texte pro Batch
+        max_batch_tokens: Obergrenze für gepaddete Tokens pro Batch
+
+    Returns:
+        Liste von Batches (Indizes in lengths), aufsteigend nach Länge
+    """
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+
+    buckets = []
+    current = []
+    for idx in order:
+        # Sortiert aufsteigend → der neue Text ist der längste im Batch
+        padded_tokens = (len(current) + 1) * lengths[idx]
+        if current and (len(current) >= batch_size or padded_tokens > max_batch_tokens):
+            buckets.append(current)
+            current = []
+        current.append(idx)
+
+    if current:
+        buckets.append(current)
+
+    return buckets
@@ -0,0 +1,185 @@
+"""
+Kommentar-Deduplizierung vor der Sentiment-Inferenz
+
+Intranet-Kommentare enthalten viele Wiederholungen ("Great article!",
+"Danke für den Artikel", kopierte Antworten). Statt jedes Vorkommen durch
+das Model zu schicken, werden Duplikate zusammengefasst, nur Repräsentanten
+bewertet und die Ergebnisse danach wieder auf alle Kommentare verteilt.
+
+Zwei Stufen:
+1. Exakt: Duplikate nach Normalisierung (Unicode NFC, casefold, Whitespace).
+   Verlustfrei für das uncased Sentiment-Model.
+2. Optional near-duplicate: MinHash + LSH über Zeichen-Shingles, Kandidaten
+   werden mit der echten Jaccard-Ähnlichkeit gegen den Schwellwert geprüft.
+"""
+
+import logging
+import unicodedata
+import zlib
+from typing import Dict, List, Set
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def normalize_comment(text: str) -> str:
+    """Normalisiert Kommentar für exakte Duplikaterkennung"""
+    return ' '.join(unicodedata.normalize('NFC', text).casefold().split())
+
+
+class CommentDeduplicator:
+    """
+    Fasst exakte und (optional) fast identische Kommentare zusammen
+    """
+
+    def __init__(
+        self,
+        near_duplicates: bool = False,
+        similarity_threshold: float = 0.9,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 5,
+        seed: int = 42
+    ):
+        """
+        Initialisiert den Deduplicator
+
+        Args:
+            near_duplicates: Auch fast identische Kommentare zusammenfassen (MinHash/LSH)
+            similarity_threshold: Minimale Jaccard-Ähnlichkeit der Shingles für near-duplicates
+            num_perm: Anzahl MinHash-Permutationen
+            bands: Anzahl LSH-Bänder (num_perm muss durch bands teilbar sein)
+            shingle_size: Länge der Zeichen-Shingles
+            seed: Seed für die MinHash-Permutationen
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) muss durch bands ({bands}) teilbar sein")
+
+        self.near_duplicates = near_duplicates
+        self.similarity_threshold = similarity_threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.RandomState(seed)
+        self._perm_a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._perm_b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def deduplicate(self, texts: List[str]) -> Dict:
+        """
+        Bestimmt Repräsentanten für eine Liste von Kommentaren
+
+        Args:
+            texts: Kommentar-Texte
+
+        Returns:
+            Dictionary mit:
+            - representatives: Texte, die tatsächlich bewertet werden müssen
+            - assignments: Für jeden Eingabetext der Index seines Repräsentanten
+            - exact_duplicates / near_duplicates: Anzahl eingesparter Texte pro Stufe
+            - dedup_ratio: Anteil eingesparter Model-Inputs (0.0 - 1.0)
+        """
+        # Stufe 1: exakte Duplikate nach Normalisierung
+        first_index = {}
+        unique_indices = []
+        text_to_unique = []
+        for i, text in enumerate(texts):
+            key = normalize_comment(text)
+            if key not in first_index:
+                first_index[key] = len(unique_indices)
+                unique_indices.append(i)
+            text_to_unique.append(first_index[key])
+
+        exact_duplicates = len(texts) - len(unique_indices)
+
+        # Stufe 2: near-duplicates unter den eindeutigen Texten
+        unique_to_rep = list(range(len(unique_indices)))
+        if self.near_duplicates and len(unique_indices) > 1:
+            unique_to_rep = self._cluster_near_duplicates(
+                [normalize_comment(texts[i]) for i in unique_indices]
+            )
+
+        # Repräsentanten kompakt durchnummerieren (Reihenfolge des ersten Vorkommens)
+        rep_position = {}
+        representatives = []
+        for u, rep in enumerate(unique_to_rep):
+            if rep not in rep_position:
+                rep_position[rep] = len(representatives)
+                representatives.append(texts[unique_indices[rep]])
+
+        assignments = [rep_position[unique_to_rep[u]] for u in text_to_unique]
+        near_duplicates = len(unique_indices) - len(representatives)
+
+        return {
+            'representatives': representatives,
+            'assignments': assignments,
+            'total': len(texts),
+            'exact_duplicates': exact_duplicates,
+            'near_duplicates': near_duplicates,
+            'dedup_ratio': round(1 - len(representatives) / len(texts), 3) if texts else 0.0,
+        }
+
+    def _shingles(self, text: str) -> Set[str]:
+        """Zeichen-Shingles eines normalisierten Textes"""
+        if len(text) <= self.shingle_size:
+            return {text}
+        return {text[i:i + self.shingle_size] for i in range(len(text) - self.shingle_size + 1)}
+
+    def _minhash(self, shingles: Set[str]) -> np.ndarray:
+        """MinHash-Signatur (num_perm Werte) für eine Shingle-Menge"""
+        hashes = np.array([zlib.crc32(s.encode('utf-8')) for s in shingles], dtype=np.uint64)
+        permuted = np.bitwise_and(
+            (np.outer(hashes, self._perm_a) + self._perm_b) % _MERSENNE_PRIME,
+            _MAX_HASH
+        )
+        return permuted.min(axis=0)
+
+    def _cluster_near_duplicates(self, normalized: List[str]) -> List[int]:
+        """
+        Gruppiert fast identische Texte per LSH und Union-Find
+
+        Args:
+            normalized: Normalisierte, paarweise verschiedene Texte
+
+        Returns:
+            Für jeden Text der Index seines Repräsentanten (kleinster Index im Cluster)
+        """
+        shingle_sets = [self._shingles(text) for text in normalized]
+        signatures = np.vstack([self._minhash(s) for s in shingle_sets])
+
+        parent = list(range(len(normalized)))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        checked = set()
+        for band in range(self.bands):
+            start = band * self.rows_per_band
+            buckets = {}
+            for i, row in enumerate(signatures[:, start:start + self.rows_per_band]):
+                buckets.setdefault(row.tobytes(), []).append(i)
+
+            for members in buckets.values():
+                for pos, i in enumerate(members):
+                    for j in members[pos + 1:]:
+                        if (i, j) in checked:
+                            continue
+                        checked.add((i, j))
+
+                        # Kandidat bestätigen mit echter Jaccard-Ähnlichkeit
+                        a, b = shingle_sets[i], shingle_sets[j]
+                        jaccard = len(a & b) / len(a | b)
+                        if jaccard >= self.similarity_threshold:
+                            root_i, root_j = find(i), find(j)
+                            if root_i != root_j:
+                                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        return [find(i) for i in range(len(normalized))]
@@ -0,0 +1,158 @@
+"""
+Persistenter Embedding-Cache für Artikel-Embeddings
+
+Speichert SentenceTransformer-Embeddings content-adressiert auf Disk:
+- embeddings.npy: float32 Matrix [n, dim], wird memory-mapped geladen
+- index.json: Cache-Key → Zeile in embeddings.npy (+ Model-Id und Dimension)
+
+Bei wiederholten Läufen werden nur neue oder geänderte Artikel encodiert,
+die restlichen Embeddings kommen direkt aus der Matrix.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from result_cache import make_key, normalize_text
+
+logger = logging.getLogger(__name__)
+
+EMBEDDINGS_FILE = "embeddings.npy"
+INDEX_FILE = "index.json"
+
+
+class EmbeddingCache:
+    """
+    Content-adressierter Embedding-Store (mmap .npy + Index-Datei)
+
+    Keys bestehen aus Model-Id und normalisiertem Text; wechselt das Model,
+    werden die alten Embeddings nicht mehr gefunden.
+    """
+
+    def __init__(self, cache_dir: str, model_id: str):
+        """
+        Öffnet (oder erstellt) den Cache
+
+        Args:
+            cache_dir: Verzeichnis für embeddings.npy und index.json
+            model_id: Identität des Embedding-Models (z.B. Model-Pfad)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.model_id = model_id
+        self.hits = 0
+        self.misses = 0
+
+        self._index: Dict[str, int] = {}
+        self._matrix = None
+        self._load()
+
+    def _load(self):
+        """Lädt Index und Matrix (memory-mapped), verwirft inkonsistente Caches"""
+        index_file = self.cache_dir / INDEX_FILE
+        matrix_file = self.cache_dir / EMBEDDINGS_FILE
+        if not index_file.exists() or not matrix_file.exists():
+            return
+
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            matrix = np.load(matrix_file, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            logger.warning(f"Embedding-Cache unlesbar, wird neu aufgebaut: {e}")
+            return
+
+        rows = index.get('rows', {})
+        if rows and max(rows.values()) >= matrix.shape[0]:
+            logger.warning("Embedding-Cache inkonsistent (Index > Matrix), wird neu aufgebaut")
+            return
+
+        self._index = rows
+        self._matrix = matrix
+
+    def _key(self, text: str) -> str:
+        return make_key(self.model_id, normalize_text(text))
+
+    def get_or_encode(self, texts: List[str], encode_fn: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """
+        Liefert Embeddings für alle Texte, encodiert nur fehlende
+
+        Args:
+            texts: Texte (z.B. Titel + Inhalt pro Artikel)
+            encode_fn: Encodiert eine Liste von Texten → Array [n, dim]
+
+        Returns:
+            float32 Array [len(texts), dim] in Eingabe-Reihenfolge
+        """
+        keys = [self._key(text) for text in texts]
+
+        # Fehlende Texte einmal pro Key encodieren (Duplikate im Export)
+        missing = {}
+        for i, key in enumerate(keys):
+            if key not in self._index and key not in missing:
+                missing[key] = i
+
+        self.misses += sum(1 for key in keys if key not in self._index)
+        self.hits += sum(1 for key in keys if key in self._index)
+
+        if missing:
+            new_embeddings = np.asarray(encode_fn([texts[i] for i in missing.values()]), dtype=np.float32)
+            self._append(list(missing.keys()), new_embeddings)
+
+        rows = np.fromiter((self._index[key] for key in keys), dtype=np.int64, count=len(keys))
+        return np.asarray(self._matrix[rows], dtype=np.float32)
+
+    def _append(self, keys: List[str], embeddings: np.ndarray):
+        """Hängt neue Embeddings an Matrix und Index an (atomar per Dateitausch)"""
+        if self._matrix is not None and self._matrix.shape[1] != embeddings.shape[1]:
+            logger.warning("Embedding-Dimension geändert, Cache wird neu aufgebaut")
+            self._matrix = None
+            self._index = {}
+
+        old_rows = 0 if self._matrix is None else self._matrix.shape[0]
+        total_rows = old_rows + embeddings.shape[0]
+
+        matrix_file = self.cache_dir / EMBEDDINGS_FILE
+        tmp_matrix = self.cache_dir / f"{EMBEDDINGS_FILE}.tmp"
+        out = np.lib.format.open_memmap(
+            tmp_matrix, mode='w+', dtype=np.float32, shape=(total_rows, embeddings.shape[1])
+        )
+        if old_rows:
+            out[:old_rows] = self._matrix
+        out[old_rows:] = embeddings
+        out.flush()
+        del out
+
+        index = dict(self._index)
+        for offset, key in enumerate(keys):
+            index[key] = old_rows + offset
+
+        tmp_index = self.cache_dir / f"{INDEX_FILE}.tmp"
+        with open(tmp_index, 'w', encoding='utf-8') as f:
+            json.dump({'model_id': self.model_id, 'dim': int(embeddings.shape[1]), 'rows': index}, f)
+
+        # Mmap der alten Matrix freigeben bevor die Datei ersetzt wird (Windows)
+        self._matrix = None
+        os.replace(tmp_matrix, matrix_file)
+        os.replace(tmp_index, self.cache_dir / INDEX_FILE)
+
+        self._index = index
+        self._matrix = np.load(matrix_file, mmap_mode='r')
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get_stats(self) -> Dict:
+        """Gibt Hit/Miss-Statistik zurück"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'entries': len(self),
+            'path': str(self.cache_dir),
+        }
@@ -0,0 +1,26 @@
+"""
+Hilfsfunktionen für lokale Model-Verzeichnisse
+
+Gemeinsam genutzt von den abgeleiteten Model-Caches (int8, bf16, ONNX) und
+den Ergebnis-Caches, deren Keys vom verwendeten Model abhängen.
+"""
+
+from pathlib import Path
+from typing import Dict
+
+
+def source_signature(model_dir: Path) -> Dict:
+    """
+    Signatur der Model-Dateien (Dateiname, Größe, Änderungszeit)
+
+    Wird von abgeleiteten Model-Caches (int8, ONNX) gespeichert: ändert sich
+    das Original-Model, passt die Signatur nicht mehr und der Cache wird neu gebaut.
+    """
+    model_dir = Path(model_dir)
+    files = sorted(
+        list(model_dir.glob("*.safetensors")) + list(model_dir.glob("*.bin")) + [model_dir / "config.json"]
+    )
+    return {
+        f.name: [f.stat().st_size, int(f.stat().st_mtime)]
+        for f in files if f.exists()
+    }
@@ -1,24 +1,43 @@
 """
 Offline Sentiment Analyzer für Corporate-Umgebungen
 Verwendet lokal gespeicherte DistilBERT Models - KEINE Internet-Verbindung nötig!
+
+Backends:
+- torch: transformers + torch (Standard)
+- onnx: onnxruntime + tokenizers (einmaliger Export, kein torch-Import zur Laufzeit)
 """
 
 import sys
+import os
+import importlib.util
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 import json
 import logging
-
-# Versuche transformers zu importieren
-try:
-    from transformers import AutoTokenizer, AutoModelForSequenceClassification
-    from transformers import pipeline
-    import torch
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
+import multiprocessing
+
+import numpy as np
+
+# torch/transformers werden erst beim Laden des Models importiert,
+# damit das ONNX-Backend ohne den (langsamen) torch-Import startet
+TRANSFORMERS_AVAILABLE = (
+    importlib.util.find_spec('transformers') is not None
+    and importlib.util.find_spec('torch') is not None
+)
+ONNX_AVAILABLE = (
+    importlib.util.find_spec('onnxruntime') is not None
+    and importlib.util.find_spec('tokenizers') is not None
+)
+if not TRANSFORMERS_AVAILABLE and not ONNX_AVAILABLE:
     print("WARNUNG: transformers nicht verfügbar. Fallback auf Lexikon-Modus.")
 
+BACKENDS = ('torch', 'onnx')
+WINDOW_AGGREGATIONS = ('mean', 'max')
+
+from batching import length_buckets
+from model_utils import source_signature
+from result_cache import ResultCache, make_key, normalize_text
+
 # Fallback auf Lexikon-Analyzer
 try:
     from llm_sentiment_analyzer import LLMSentimentAnalyzer
@@ -29,6 +48,27 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Version des Label-Mappings in _convert_result - erhöhen wenn sich das Mapping
+# ändert, damit alte Cache-Einträge nicht mehr verwendet werden
+LABEL_MAPPING_VERSION = "1"
+
+# Analyzer-Instanz in Worker-Prozessen (siehe num_workers)
+_worker_analyzer = None
+
+
+def _init_worker(model_dir: str, init_kwargs: Dict, num_threads: int):
+    """Initialisiert einen Worker-Prozess: Model einmal laden, Threads fixieren"""
+    global _worker_analyzer
+    if init_kwargs.get('backend', 'torch') == 'torch':
+        import torch
+        torch.set_num_threads(num_threads)
+    _worker_analyzer = OfflineSentimentAnalyzer(model_dir=model_dir, intra_op_threads=num_threads, **init_kwargs)
+
+
+def _predict_in_worker(batch_ids):
+    """Bewertet einen tokenisierten Batch im Worker-Prozess (Wahrscheinlichkeiten pro Zeile)"""
+    return _worker_analyzer._predict_probs(batch_ids)
+
 
 class OfflineSentimentAnalyzer:
     """
@@ -36,7 +76,24 @@ class OfflineSentimentAnalyzer:
     Verwendet lokal gespeicherte Models - KEINE HuggingFace-Verbindung nötig
     """
 
-    def __init__(self, model_dir: Optional[str] = None, fallback_to_lexicon: bool = True):
+    def __init__(
+        self,
+        model_dir: Optional[str] = None,
+        fallback_to_lexicon: bool = True,
+        batch_size: int = 32,
+        max_length: int = 512,
+        max_batch_tokens: int = 8192,
+        cache_path: Optional[str] = None,
+        cache_max_entries: int = 200000,
+        num_workers: int = 1,
+        threads_per_worker: Optional[int] = None,
+        quantize: bool = False,
+        quantize_min_agreement: float = 0.95,
+        backend: str = 'torch',
+        intra_op_threads: Optional[int] = None,
+        window_overlap: int = 128,
+        window_aggregation: str = 'mean'
+    ):
         """
         Initialisiert den Offline Sentiment Analyzer
 
@@ -44,18 +101,60 @@ class OfflineSentimentAnalyzer:
             model_dir: Pfad zum lokal gespeicherten Model
                       (None = automatische Erkennung)
             fallback_to_lexicon: Fallback auf Lexikon wenn Model nicht verfügbar
+            batch_size: Default Batch-Größe für analyze_batch()
+            max_length: Maximale Token-Länge pro Text
+            max_batch_tokens: Obergrenze für gepaddete Tokens pro Batch (Anzahl × Länge)
+            cache_path: SQLite-Datei für persistenten Ergebnis-Cache (None = kein Cache)
+            cache_max_entries: Maximale Cache-Größe (LRU-Eviction darüber)
+            num_workers: Anzahl Worker-Prozesse für analyze_batch (1 = im eigenen Prozess)
+            threads_per_worker: Torch-Threads pro Worker (None = CPU-Kerne / num_workers)
+            quantize: int8-quantisiertes Model verwenden (wird einmalig erstellt und gecacht)
+            quantize_min_agreement: Minimale Label-Übereinstimmung int8 vs fp32, sonst fp32
+            backend: 'torch' (transformers) oder 'onnx' (onnxruntime, Export wird gecacht)
+            intra_op_threads: Threads für die ONNX-Session (None = onnxruntime Default)
+            window_overlap: Überlappung (Tokens) der Fenster bei Texten länger als max_length
+            window_aggregation: Zusammenfassung der Fenster pro Text
+                               ('mean' = gemittelte Wahrscheinlichkeiten, 'max' = sicherstes Fenster)
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unbekanntes Backend: {backend} (erlaubt: {', '.join(BACKENDS)})")
+        if window_aggregation not in WINDOW_AGGREGATIONS:
+            raise ValueError(
+                f"Unbekannte Fenster-Aggregation: {window_aggregation} (erlaubt: {', '.join(WINDOW_AGGREGATIONS)})"
+            )
+        if not 0 <= window_overlap < max_length - 2:
+            raise ValueError(f"window_overlap muss zwischen 0 und {max_length - 3} liegen")
+
         self.model = None
         self.tokenizer = None
-        self.pipe = None
+        self.onnx_model = None
+        self.id2label = {}
         self.mode = None
         self.fallback_to_lexicon = fallback_to_lexicon
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.max_batch_tokens = max_batch_tokens
+        self.window_overlap = window_overlap
+        self.window_aggregation = window_aggregation
+        self.model_fingerprint = None
+        self.cache = None
+        self.model_dir = None
+        self.quantize = quantize
+        self.quantize_min_agreement = quantize_min_agreement
+        self.precision = 'fp32'
+        self.quantization_info = None
+        self.backend = backend
+        self.intra_op_threads = intra_op_threads
+        self.num_workers = max(1, num_workers)
+        self.threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // self.num_workers)
+        self._pool = None
 
         # Automatische Model-Erkennung
         if model_dir is None:
             model_dir = self._find_model()
 
-        if model_dir and TRANSFORMERS_AVAILABLE:
+        backend_available = ONNX_AVAILABLE if backend == 'onnx' else TRANSFORMERS_AVAILABLE
+        if model_dir and backend_available:
             try:
                 self._load_offline_model(model_dir)
                 self.mode = 'bert'
@@ -66,6 +165,11 @@ class OfflineSentimentAnalyzer:
         else:
             self._setup_fallback()
 
+        # Ergebnis-Cache nur im BERT-Modus (Lexikon ist ohnehin schnell)
+        if cache_path and self.mode == 'bert':
+            self.cache = ResultCache(cache_path, max_entries=cache_max_entries)
+            logger.info(f"Sentiment-Cache: {cache_path} ({len(self.cache)} Einträge)")
+
     def _find_model(self) -> Optional[Path]:
         """Sucht nach lokal gespeichertem Model"""
         base_dir = Path(__file__).parent / "models"
@@ -92,35 +196,100 @@ class OfflineSentimentAnalyzer:
         Args:
             model_dir: Pfad zum Model-Verzeichnis
         """
-        logger.info(f"Lade Model von: {model_dir}")
-
-        # Wichtig: local_files_only=True verhindert HuggingFace-Download
-        self.tokenizer = AutoTokenizer.from_pretrained(
-            str(model_dir),
-            local_files_only=True  # ← WICHTIG für Corporate-Umgebungen!
-        )
+        model_dir = Path(model_dir)
+        self.model_dir = model_dir
+        logger.info(f"Lade Model von: {model_dir} (Backend: {self.backend})")
 
-        self.model = AutoModelForSequenceClassification.from_pretrained(
-            str(model_dir),
-            local_files_only=True  # ← WICHTIG für Corporate-Umgebungen!
-        )
+        if self.backend == 'onnx':
+            from onnx_backend import OnnxSentimentModel
 
-        # Erstelle Pipeline für einfache Verwendung
-        self.pipe = pipeline(
-            "sentiment-analysis",
-            model=self.model,
-            tokenizer=self.tokenizer,
-            device=-1  # CPU (verwende 0 für GPU)
-        )
+            if self.quantize:
+                logger.warning("int8-Quantisierung wird nur vom torch-Backend unterstützt - ignoriert")
+            self.onnx_model = OnnxSentimentModel(model_dir, intra_op_threads=self.intra_op_threads)
+            self.id2label = self.onnx_model.id2label
+        else:
+            self._load_torch_model(model_dir)
 
         # Lade Metadata wenn vorhanden
+        metadata_text = ""
         metadata_file = model_dir / "model_info.json"
         if metadata_file.exists():
             with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+                metadata_text = f.read()
+                metadata = json.loads(metadata_text)
                 logger.info(f"Model Info: {metadata.get('model_name', 'unknown')}")
                 logger.info(f"Languages: {', '.join(metadata.get('languages', []))}")
 
+        # Model-Identität für Cache-Keys (Pfad + Metadata + Label-Mapping + Fenster + Präzision/Backend)
+        self.model_fingerprint = make_key(
+            str(model_dir.resolve()),
+            metadata_text,
+            LABEL_MAPPING_VERSION,
+            str(self.max_length),
+            str(self.window_overlap),
+            self.window_aggregation,
+            self.precision,
+            self.backend
+        )
+
+    def _load_torch_model(self, model_dir: Path):
+        """Lädt Tokenizer + Model mit transformers (torch-Backend)"""
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+        # Wichtig: local_files_only=True verhindert HuggingFace-Download
+        self.tokenizer = AutoTokenizer.from_pretrained(
+            str(model_dir),
+            local_files_only=True  # ← WICHTIG für Corporate-Umgebungen!
+        )
+
+        if self.quantize:
+            self.model = self._load_quantized_model(model_dir)
+
+        if self.model is None:
+            self.model = AutoModelForSequenceClassification.from_pretrained(
+                str(model_dir),
+                local_files_only=True  # ← WICHTIG für Corporate-Umgebungen!
+            )
+
+        self.model.eval()
+        self.id2label = self.model.config.id2label
+
+    def _load_quantized_model(self, model_dir: Path):
+        """
+        Lädt die int8-Variante des Models (erstellt sie beim ersten Aufruf)
+
+        Returns:
+            Quantisiertes Model, oder None wenn der Agreement-Check nicht bestanden wurde
+            oder nicht möglich war (keine Evaluations-Kommentare)
+        """
+        from transformers import AutoModelForSequenceClassification
+        from quantization import load_quantized, quantized_dir_for, read_quantization_info
+        from quantize_sentiment_model import build_quantized_sentiment_model
+
+        target_dir = quantized_dir_for(model_dir)
+        info = read_quantization_info(target_dir)
+
+        if info is None or info.get('source_signature') != source_signature(model_dir):
+            logger.info(f"Erstelle int8-Model (einmalig) → {target_dir}")
+            try:
+                info = build_quantized_sentiment_model(model_dir, min_agreement=self.quantize_min_agreement)
+            except ValueError as e:
+                logger.warning(f"int8-Model nicht erstellt: {e} → verwende fp32")
+                return None
+
+        self.quantization_info = info
+        if info['agreement'] < self.quantize_min_agreement:
+            logger.warning(
+                f"int8-Model abgelehnt: Agreement {info['agreement']:.1%} < "
+                f"{self.quantize_min_agreement:.1%} → verwende fp32"
+            )
+            return None
+
+        model = load_quantized(AutoModelForSequenceClassification, model_dir, target_dir)
+        self.precision = 'int8'
+        logger.info(f"int8-Model geladen (Agreement {info['agreement']:.1%} auf {info['eval_samples']} Kommentaren)")
+        return model
+
     def _setup_fallback(self):
         """Setup Fallback auf Lexikon-Modus"""
         if self.fallback_to_lexicon and LEXICON_AVAILABLE:
@@ -158,50 +327,7 @@ class OfflineSentimentAnalyzer:
 
     def _analyze_with_distilbert(self, text: str) -> Dict:
         """Analysiert mit BERT Model (unterstützt 3-class und 5-star Models)"""
-        try:
-            # Pipeline gibt Label + Score zurück
-            result = self.pipe(text[:512])[0]  # Truncate zu max_length
-
-            # Konvertiere zu standardisiertem Format
-            label = result['label'].lower()
-            confidence = result['score']
-
-            # Label mapping für verschiedene Model-Typen
-            if 'star' in label:
-                # 5-star rating model (z.B. nlptown)
-                if '5 star' in label or '4 star' in label:
-                    category = 'positive'
-                    score = 0.8 if '5 star' in label else 0.5
-                elif '1 star' in label or '2 star' in label:
-                    category = 'negative'
-                    score = -0.8 if '1 star' in label else -0.5
-                else:  # 3 stars
-                    category = 'neutral'
-                    score = 0.0
-            elif 'positive' in label or label == 'label_2':
-                category = 'positive'
-                score = confidence
-            elif 'negative' in label or label == 'label_0':
-                category = 'negative'
-                score = -confidence
-            else:
-                category = 'neutral'
-                score = 0.0
-
-            return {
-                'score': round(score, 3),
-                'category': category,
-                'confidence': round(confidence, 3),
-                'mode': 'bert',
-                'raw_label': result['label']
-            }
-
-        except Exception as e:
-            logger.error(f"DistilBERT Fehler: {e}")
-            if self.fallback_to_lexicon:
-                logger.info("Fallback auf Lexikon")
-                return self._analyze_with_lexicon(text)
-            raise
+        return self._score_texts([text], self.batch_size)[0]
 
     def _analyze_with_lexicon(self, text: str) -> Dict:
         """Analysiert mit Lexikon (Fallback)"""
@@ -209,31 +335,274 @@ class OfflineSentimentAnalyzer:
         result['mode'] = 'lexicon'
         return result
 
-    def analyze_batch(self, texts: List[str], batch_size: int = 8) -> List[Dict]:
+    def analyze_batch(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict]:
         """
         Analysiert mehrere Texte
 
+        Im BERT-Modus werden alle Texte einmal tokenisiert, nach Token-Länge
+        sortiert und in Längen-Buckets gebündelt. Jeder Batch wird nur auf die
+        Länge seines längsten Textes gepaddet (ein Forward-Pass pro Batch unter
+        torch.inference_mode); die Ergebnisse kommen in Eingabe-Reihenfolge zurück.
+        Texte länger als max_length werden in überlappende Fenster geteilt
+        (siehe _score_texts).
+
         Args:
             texts: Liste von Texten
-            batch_size: Batch-Größe für BERT
+            batch_size: Batch-Größe für BERT (None = Default aus __init__)
+            progress_callback: Optional, wird nach jedem Batch mit (fertig, gesamt) aufgerufen
 
         Returns:
-            Liste von Sentiment-Ergebnissen
+            Liste von Sentiment-Ergebnissen (gleiche Reihenfolge wie texts)
         """
+        if batch_size is None:
+            batch_size = self.batch_size
+
         if self.mode == 'bert' or self.mode == 'distilbert':
-            # Batch-Processing mit BERT
-            results = []
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i+batch_size]
-                batch_results = self.pipe(batch)
-                results.extend(batch_results)
-
-            # Konvertiere zu standardisiertem Format
-            return [self._convert_result(r) for r in results]
+            results = [None] * len(texts)
+
+            # Leere/ungültige Texte wie in analyze() behandeln
+            valid_indices = []
+            for i, text in enumerate(texts):
+                if not text or not isinstance(text, str):
+                    results[i] = self.analyze(text)
+                else:
+                    valid_indices.append(i)
+
+            # Persistenter Cache: bereits bewertete Texte überspringen
+            cache_keys = {}
+            if self.cache is not None:
+                cache_keys = {
+                    i: make_key(self.model_fingerprint, normalize_text(texts[i]))
+                    for i in valid_indices
+                }
+                cached = self.cache.get_many(list(cache_keys.values()))
+                pending_indices = []
+                for i in valid_indices:
+                    if cache_keys[i] in cached:
+                        results[i] = dict(cached[cache_keys[i]])
+                    else:
+                        pending_indices.append(i)
+                valid_indices = pending_indices
+
+            if not valid_indices:
+                return results
+
+            scored = self._score_texts([texts[i] for i in valid_indices], batch_size, progress_callback)
+            for i, result in zip(valid_indices, scored):
+                results[i] = result
+
+            if self.cache is not None:
+                # Nur echte BERT-Ergebnisse speichern (keine Lexikon-Fallbacks)
+                self.cache.put_many({
+                    cache_keys[i]: results[i]
+                    for i in valid_indices
+                    if results[i].get('mode') == 'bert'
+                })
+
+            return results
         else:
             # Lexikon-Modus
             return [self.analyze(text) for text in texts]
 
+    def _score_texts(
+        self,
+        texts: List[str],
+        batch_size: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict]:
+        """
+        Bewertet nicht-leere Texte mit dem BERT-Model (ohne Cache)
+
+        Alle Fenster aller Texte werden gemeinsam nach Länge gebündelt, d.h.
+        die Fenster eines langen Kommentars teilen sich Batches mit kurzen
+        Kommentaren. Danach werden die Fenster-Wahrscheinlichkeiten pro Text
+        aggregiert (window_aggregation).
+
+        Args:
+            texts: Nicht-leere Texte
+            batch_size: Maximale Anzahl Fenster pro Batch
+            progress_callback: Optional, wird nach jedem Batch mit (fertige Texte, gesamt) aufgerufen
+
+        Returns:
+            Sentiment-Ergebnisse (gleiche Reihenfolge wie texts)
+        """
+        # Einmal tokenisieren (ohne Padding), lange Texte in Fenster teilen
+        window_ids = []
+        window_owner = []
+        for j, ids in enumerate(self._encode(texts)):
+            for window in self._split_windows(ids):
+                window_ids.append(window)
+                window_owner.append(j)
+
+        buckets = length_buckets([len(ids) for ids in window_ids], batch_size, self.max_batch_tokens)
+
+        tasks = ([window_ids[k] for k in bucket] for bucket in buckets)
+        if self.num_workers > 1 and len(buckets) > 1:
+            # Batches auf Worker-Prozesse verteilen, Ergebnisse kommen in Reihenfolge zurück
+            probs_iter = self._get_pool().imap(_predict_in_worker, tasks)
+        else:
+            probs_iter = (self._predict_probs(task) for task in tasks)
+
+        window_probs = [None] * len(window_ids)
+        failed = set()
+        remaining = [0] * len(texts)
+        for j in window_owner:
+            remaining[j] += 1
+
+        done = 0
+        for bucket, probs in zip(buckets, probs_iter):
+            for row, k in enumerate(bucket):
+                owner = window_owner[k]
+                if probs is None:
+                    failed.add(owner)
+                else:
+                    window_probs[k] = probs[row]
+
+                remaining[owner] -= 1
+                if remaining[owner] == 0:
+                    done += 1
+
+            if progress_callback:
+                progress_callback(done, len(texts))
+
+        # Fenster-Wahrscheinlichkeiten pro Text zusammenfassen
+        per_text = [[] for _ in texts]
+        for k, owner in enumerate(window_owner):
+            if owner not in failed:
+                per_text[owner].append(window_probs[k])
+
+        results = []
+        for j, text in enumerate(texts):
+            if j in failed:
+                logger.info("Fallback auf Lexikon")
+                results.append(self._lexicon_fallback(text))
+            else:
+                results.append(self._aggregate_windows(np.vstack(per_text[j])))
+
+        return results
+
+    def _split_windows(self, ids: List[int]) -> List[List[int]]:
+        """
+        Teilt eine Token-Sequenz (mit Special Tokens) in überlappende Fenster
+
+        Jedes Fenster behält das erste und letzte Special Token ([CLS] ... [SEP])
+        und ist höchstens max_length lang; aufeinanderfolgende Fenster
+        überlappen um window_overlap Tokens.
+        """
+        if len(ids) <= self.max_length:
+            return [ids]
+
+        prefix, body, suffix = ids[:1], ids[1:-1], ids[-1:]
+        span = self.max_length - len(prefix) - len(suffix)
+        stride = span - self.window_overlap
+
+        windows = []
+        for start in range(0, len(body), stride):
+            windows.append(prefix + body[start:start + span] + suffix)
+            if start + span >= len(body):
+                break
+        return windows
+
+    def _aggregate_windows(self, probs: np.ndarray) -> Dict:
+        """Fasst die Wahrscheinlichkeiten aller Fenster eines Textes zu einem Ergebnis zusammen"""
+        if self.window_aggregation == 'max':
+            # Fenster mit der höchsten Konfidenz entscheidet
+            text_probs = probs[probs.max(axis=-1).argmax()]
+        else:
+            text_probs = probs.mean(axis=0)
+
+        label_id = int(text_probs.argmax())
+        return self._convert_result({'label': self.id2label[label_id], 'score': float(text_probs[label_id])})
+
+    def _get_pool(self):
+        """Startet den Worker-Pool beim ersten Gebrauch (jeder Worker lädt das Model einmal)"""
+        if self._pool is None:
+            logger.info(f"Starte {self.num_workers} Sentiment-Worker ({self.threads_per_worker} Threads/Worker)...")
+            init_kwargs = {
+                'fallback_to_lexicon': self.fallback_to_lexicon,
+                'max_length': self.max_length,
+                'max_batch_tokens': self.max_batch_tokens,
+                'quantize': self.quantize,
+                'quantize_min_agreement': self.quantize_min_agreement,
+                'backend': self.backend,
+                'window_overlap': self.window_overlap,
+                'window_aggregation': self.window_aggregation,
+            }
+            # spawn statt fork: torch/OpenMP/onnxruntime vertragen kein fork nach Initialisierung
+            self._pool = multiprocessing.get_context('spawn').Pool(
+                processes=self.num_workers,
+                initializer=_init_worker,
+                initargs=(str(self.model_dir), init_kwargs, self.threads_per_worker)
+            )
+        return self._pool
+
+    def close(self):
+        """Beendet Worker-Pool und schließt den Cache"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    def _encode(self, texts: List[str]) -> List[List[int]]:
+        """Tokenisiert Texte vollständig (mit Special Tokens, ohne Padding/Truncation)"""
+        if self.onnx_model is not None:
+            return self.onnx_model.encode(texts)
+
+        # verbose=False: keine Warnung für Sequenzen > max_length (werden in Fenster geteilt)
+        return self.tokenizer(texts, truncation=False, verbose=False)['input_ids']
+
+    def _forward(self, batch_ids: List[List[int]]) -> np.ndarray:
+        """Ein Forward-Pass, gibt Logits [batch, num_labels] zurück"""
+        if self.onnx_model is not None:
+            return self.onnx_model.predict(batch_ids)
+
+        import torch
+
+        # Dynamisches Padding nur bis zur längsten Sequenz dieses Batches
+        encoded = self.tokenizer.pad(
+            {'input_ids': batch_ids},
+            padding=True,
+            return_tensors='pt'
+        )
+
+        with torch.inference_mode():
+            return self.model(**encoded).logits.float().numpy()
+
+    def _predict_probs(self, batch_ids: List[List[int]]) -> Optional[np.ndarray]:
+        """
+        Ein Forward-Pass für einen Batch bereits tokenisierter Fenster
+
+        Returns:
+            Wahrscheinlichkeiten [batch, num_labels], oder None bei Fehler mit
+            Lexikon-Fallback (Texte werden dann vom Aufrufer per Lexikon bewertet)
+        """
+        try:
+            logits = self._forward(batch_ids)
+
+            # Softmax (numerisch stabil)
+            exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            return exp / exp.sum(axis=-1, keepdims=True)
+
+        except Exception as e:
+            logger.error(f"BERT Batch Fehler: {e}")
+            if self.fallback_to_lexicon and LEXICON_AVAILABLE:
+                return None
+            raise
+
+    def _lexicon_fallback(self, text: str) -> Dict:
+        """Bewertet einen Text per Lexikon, wenn das BERT-Model fehlschlägt"""
+        if not hasattr(self, 'lexicon_analyzer'):
+            self.lexicon_analyzer = LLMSentimentAnalyzer(use_bert=False)
+        return self._analyze_with_lexicon(text)
+
     def _convert_result(self, result: Dict) -> Dict:
         """Konvertiert BERT-Ergebnis zu Standard-Format"""
         label = result['label'].lower()
@@ -298,7 +667,10 @@ class OfflineSentimentAnalyzer:
         """Gibt Informationen über den Analyzer zurück"""
         info = {
             'mode': self.mode,
+            'backend': self.backend,
+            'precision': self.precision,
             'transformers_available': TRANSFORMERS_AVAILABLE,
+            'onnx_available': ONNX_AVAILABLE,
             'lexicon_available': LEXICON_AVAILABLE,
         }
 
@@ -306,8 +678,15 @@ class OfflineSentimentAnalyzer:
             info['model_type'] = self.model.config.model_type
             info['num_labels'] = self.model.config.num_labels
 
+        if self.cache is not None:
+            info['cache'] = self.cache.get_stats()
+
         return info
 
+    def get_cache_stats(self) -> Optional[Dict]:
+        """Gibt Hit/Miss-Statistik des Ergebnis-Caches zurück (None ohne Cache)"""
+        return self.cache.get_stats() if self.cache is not None else None
+
 
 if __name__ == "__main__":
     # Test
@@ -0,0 +1,183 @@
+"""
+ONNX Runtime Backend für das Sentiment-Model
+
+Das lokale Sentiment-Model wird einmalig nach ONNX exportiert (benötigt
+torch + transformers) und neben dem Original gespeichert
+(z.B. models/sentiment-multilingual-onnx/). Danach läuft die Inferenz nur
+mit onnxruntime + tokenizers - ohne torch/transformers zu importieren,
+was den Kaltstart deutlich verkürzt. Alles läuft komplett offline.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from model_utils import source_signature
+
+logger = logging.getLogger(__name__)
+
+ONNX_MODEL_FILE = "model.onnx"
+ONNX_INFO_FILE = "onnx_info.json"
+ONNX_INPUT_NAMES = ['input_ids', 'attention_mask', 'token_type_ids']
+
+
+def onnx_dir_for(model_dir: Path) -> Path:
+    """Cache-Verzeichnis des exportierten ONNX-Models (neben dem Original)"""
+    model_dir = Path(model_dir)
+    return model_dir.parent / f"{model_dir.name}-onnx"
+
+
+def is_export_current(model_dir: Path) -> bool:
+    """Prüft ob ein ONNX-Export existiert und zu den aktuellen Original-Gewichten passt"""
+    target_dir = onnx_dir_for(model_dir)
+    info_file = target_dir / ONNX_INFO_FILE
+    if not (target_dir / ONNX_MODEL_FILE).exists() or not info_file.exists():
+        return False
+    with open(info_file, 'r', encoding='utf-8') as f:
+        info = json.load(f)
+    return info.get('source_signature') == source_signature(model_dir)
+
+
+def export_to_onnx(model_dir: Path, opset_version: int = 14) -> Path:
+    """
+    Exportiert das Sentiment-Model nach ONNX (einmalig, benötigt torch)
+
+    Args:
+        model_dir: Verzeichnis des Original-Models
+        opset_version: ONNX Opset
+
+    Returns:
+        Pfad zur exportierten model.onnx
+    """
+    import torch
+    from transformers import AutoModelForSequenceClassification
+
+    model_dir = Path(model_dir)
+    target_dir = onnx_dir_for(model_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    model = AutoModelForSequenceClassification.from_pretrained(str(model_dir), local_files_only=True)
+    model.eval()
+
+    class LogitsOnly(torch.nn.Module):
+        """Gibt nur die Logits zurück (ONNX braucht Tensor-Outputs)"""
+
+        def __init__(self, wrapped):
+            super().__init__()
+            self.wrapped = wrapped
+
+        def forward(self, input_ids, attention_mask, token_type_ids):
+            return self.wrapped(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                token_type_ids=token_type_ids
+            ).logits
+
+    dummy = torch.ones((2, 8), dtype=torch.long)
+    onnx_path = target_dir / ONNX_MODEL_FILE
+    torch.onnx.export(
+        LogitsOnly(model),
+        (dummy, dummy, torch.zeros_like(dummy)),
+        str(onnx_path),
+        input_names=ONNX_INPUT_NAMES,
+        output_names=['logits'],
+        dynamic_axes={
+            **{name: {0: 'batch', 1: 'sequence'} for name in ONNX_INPUT_NAMES},
+            'logits': {0: 'batch'},
+        },
+        opset_version=opset_version,
+        dynamo=False
+    )
+
+    with open(target_dir / ONNX_INFO_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'source_model': model_dir.name,
+            'source_signature': source_signature(model_dir),
+            'opset_version': opset_version,
+        }, f, indent=2)
+
+    logger.info(f"ONNX-Export gespeichert: {onnx_path}")
+    return onnx_path
+
+
+class OnnxSentimentModel:
+    """
+    Sentiment-Inferenz mit onnxruntime (Graph-Optimierungen + IO Binding)
+    """
+
+    def __init__(self, model_dir: Path, intra_op_threads: Optional[int] = None):
+        """
+        Lädt Tokenizer und ONNX-Session (exportiert bei Bedarf einmalig)
+
+        Args:
+            model_dir: Verzeichnis des Original-Models (Tokenizer + config.json)
+            intra_op_threads: Threads pro Inferenz (None = onnxruntime Default)
+        """
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_dir = Path(model_dir)
+        if not is_export_current(model_dir):
+            logger.info(f"Exportiere Model nach ONNX (einmalig) → {onnx_dir_for(model_dir)}")
+            export_to_onnx(model_dir)
+
+        # Tokenizer ohne transformers laden (gleiche tokenizer.json wie AutoTokenizer)
+        self.tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self.tokenizer.no_padding()
+        self.tokenizer.no_truncation()
+
+        with open(model_dir / "config.json", 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        self.id2label: Dict[int, str] = {int(k): v for k, v in config['id2label'].items()}
+        self.pad_token_id = config.get('pad_token_id', 0)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+
+        self.session = ort.InferenceSession(
+            str(onnx_dir_for(model_dir) / ONNX_MODEL_FILE),
+            sess_options=options,
+            providers=['CPUExecutionProvider']
+        )
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def encode(self, texts: List[str]) -> List[List[int]]:
+        """Tokenisiert Texte (mit Special Tokens, ohne Padding/Truncation)"""
+        return [encoding.ids for encoding in self.tokenizer.encode_batch(texts)]
+
+    def predict(self, batch_ids: List[List[int]]) -> np.ndarray:
+        """
+        Ein Forward-Pass für einen Batch tokenisierter Texte
+
+        Args:
+            batch_ids: Token-IDs pro Text (unterschiedliche Längen)
+
+        Returns:
+            Logits als Array [batch, num_labels]
+        """
+        max_len = max(len(ids) for ids in batch_ids)
+        input_ids = np.full((len(batch_ids), max_len), self.pad_token_id, dtype=np.int64)
+        attention_mask = np.zeros((len(batch_ids), max_len), dtype=np.int64)
+        for row, ids in enumerate(batch_ids):
+            input_ids[row, :len(ids)] = ids
+            attention_mask[row, :len(ids)] = 1
+
+        inputs = {
+            'input_ids': input_ids,
+            'attention_mask': attention_mask,
+            'token_type_ids': np.zeros_like(input_ids),
+        }
+
+        # IO Binding: Inputs direkt binden, Output von onnxruntime allokieren lassen
+        binding = self.session.io_binding()
+        for name, value in inputs.items():
+            if name in self._input_names:
+                binding.bind_cpu_input(name, value)
+        binding.bind_output('logits')
+        self.session.run_with_iobinding(binding)
+        return binding.copy_outputs_to_cpu()[0]
@@ -0,0 +1,126 @@
+"""
+Dynamische int8-Quantisierung für Transformer-Modelle (CPU)
+
+Linear-Layer werden nach int8 konvertiert (Gewichte int8, Aktivierungen
+werden zur Laufzeit quantisiert). Das halbiert typischerweise Latenz und
+Speicherbedarf auf CPU, ohne Kalibrierungsdaten zu benötigen.
+
+Das konvertierte Model wird als state_dict neben dem Original-Model
+gespeichert und beim nächsten Start direkt geladen.
+
+Alternativ: bfloat16-Kopie (halber Speicher, auf CPUs mit AVX512-BF16/AMX
+auch schneller), gespeichert als safetensors neben dem Original.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+QUANTIZED_WEIGHTS_FILE = "model_int8.pt"
+QUANTIZATION_INFO_FILE = "quantization_info.json"
+BF16_WEIGHTS_FILE = "model.safetensors"
+
+
+def quantized_dir_for(model_dir: Path) -> Path:
+    """Cache-Verzeichnis des quantisierten Models (neben dem Original)"""
+    model_dir = Path(model_dir)
+    return model_dir.parent / f"{model_dir.name}-int8"
+
+
+def bf16_dir_for(model_dir: Path) -> Path:
+    """Cache-Verzeichnis der bfloat16-Kopie (neben dem Original)"""
+    model_dir = Path(model_dir)
+    return model_dir.parent / f"{model_dir.name}-bf16"
+
+
+def cpu_supports_bf16() -> bool:
+    """Prüft ob die CPU bfloat16 nativ unterstützt (oneDNN, z.B. AVX512-BF16/AMX)"""
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except (AttributeError, RuntimeError):
+        return False
+
+
+def quantize_dynamic_int8(model: torch.nn.Module) -> torch.nn.Module:
+    """Quantisiert alle Linear-Layer dynamisch nach int8"""
+    model.eval()
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def save_quantized(model: torch.nn.Module, target_dir: Path, info: Dict):
+    """
+    Speichert quantisiertes Model + Metadata
+
+    Args:
+        model: Quantisiertes Model
+        target_dir: Zielverzeichnis
+        info: Metadata (z.B. Agreement-Check), wird als JSON gespeichert
+    """
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    torch.save(model.state_dict(), target_dir / QUANTIZED_WEIGHTS_FILE)
+    with open(target_dir / QUANTIZATION_INFO_FILE, 'w', encoding='utf-8') as f:
+        json.dump(info, f, indent=2)
+
+
+def save_bf16(model: torch.nn.Module, target_dir: Path, info: Dict):
+    """
+    Speichert eine bfloat16-Kopie des Models (safetensors) + Metadata
+
+    Args:
+        model: transformers Model (wird nach bfloat16 konvertiert)
+        target_dir: Zielverzeichnis
+        info: Metadata, wird als JSON gespeichert
+    """
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    model.to(torch.bfloat16).save_pretrained(str(target_dir), safe_serialization=True)
+    with open(target_dir / QUANTIZATION_INFO_FILE, 'w', encoding='utf-8') as f:
+        json.dump(info, f, indent=2)
+
+
+def read_quantization_info(target_dir: Path, weights_file: str = QUANTIZED_WEIGHTS_FILE) -> Optional[Dict]:
+    """Liest die Metadata eines konvertierten Models (None wenn nicht vorhanden)"""
+    target_dir = Path(target_dir)
+    info_file = target_dir / QUANTIZATION_INFO_FILE
+    if not info_file.exists() or not (target_dir / weights_file).exists():
+        return None
+    with open(info_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_quantized(model_class, source_dir: Path, target_dir: Path) -> torch.nn.Module:
+    """
+    Lädt ein gespeichertes quantisiertes Model
+
+    Die Architektur wird aus der config.json des Originals aufgebaut, die
+    fp32-Gewichte werden dabei nicht geladen.
+
+    Args:
+        model_class: transformers Model-Klasse (z.B. AutoModelForSequenceClassification)
+        source_dir: Verzeichnis des Original-Models (config.json)
+        target_dir: Verzeichnis des quantisierten Models
+
+    Returns:
+        Quantisiertes Model im eval-Modus
+    """
+    from transformers import AutoConfig
+
+    config = AutoConfig.from_pretrained(str(source_dir), local_files_only=True)
+    model = quantize_dynamic_int8(model_class.from_config(config))
+    state_dict = torch.load(Path(target_dir) / QUANTIZED_WEIGHTS_FILE, map_location='cpu')
+    model.load_state_dict(state_dict)
+    model.eval()
+    return model
+
+
+def label_agreement(reference: List, candidate: List) -> float:
+    """Anteil übereinstimmender Labels zwischen Referenz und Kandidat"""
+    if not reference:
+        return 1.0
+    return sum(1 for a, b in zip(reference, candidate) if a == b) / len(reference)
@@ -0,0 +1,179 @@
+"""
+Build-Schritt: int8-quantisiertes Sentiment-Model erstellen
+
+Erstellt eine dynamisch quantisierte Variante (int8 Linear-Layer) des lokalen
+Sentiment-Models und speichert sie neben dem Original
+(z.B. models/sentiment-multilingual-int8/).
+
+Agreement-Check: Beide Models bewerten die Kommentare aus
+test_realistic_articles.json. Die Label-Übereinstimmung wird in
+quantization_info.json gespeichert; OfflineSentimentAnalyzer verwendet das
+int8-Model nur, wenn sie mindestens dem geforderten Schwellwert entspricht.
+
+Verwendung:
+    python "LLM Solution/quantize_sentiment_model.py" --min-agreement 0.95
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import torch
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+from quantization import (
+    label_agreement,
+    quantize_dynamic_int8,
+    quantized_dir_for,
+    save_quantized,
+)
+from model_utils import source_signature
+
+DEFAULT_MODEL_DIR = Path(__file__).parent / "models" / "sentiment-multilingual"
+DEFAULT_EVAL_FILE = Path(__file__).parent.parent / "test_realistic_articles.json"
+DEFAULT_MIN_AGREEMENT = 0.95
+
+
+def load_eval_comments(eval_file: Path) -> List[str]:
+    """Lädt alle Kommentar-Texte aus einer Artikel-JSON-Datei"""
+    with open(eval_file, 'r', encoding='utf-8') as f:
+        articles = json.load(f)
+
+    return [
+        comment.get('text', '')
+        for article in articles
+        for comment in article.get('comments', [])
+        if comment.get('text', '')
+    ]
+
+
+def predict_labels(model, tokenizer, texts: List[str], batch_size: int = 16) -> List[int]:
+    """Label-IDs (argmax) für eine Liste von Texten"""
+    labels = []
+    for start in range(0, len(texts), batch_size):
+        encoded = tokenizer(
+            texts[start:start + batch_size],
+            padding=True,
+            truncation=True,
+            max_length=512,
+            return_tensors='pt'
+        )
+        with torch.inference_mode():
+            logits = model(**encoded).logits
+        labels.extend(logits.argmax(dim=-1).tolist())
+    return labels
+
+
+def build_quantized_sentiment_model(
+    model_dir: Path = DEFAULT_MODEL_DIR,
+    eval_file: Path = DEFAULT_EVAL_FILE,
+    min_agreement: float = DEFAULT_MIN_AGREEMENT
+) -> Dict:
+    """
+    Quantisiert das Sentiment-Model und prüft die Label-Übereinstimmung mit fp32
+
+    Args:
+        model_dir: Verzeichnis des fp32 Models
+        eval_file: Artikel-JSON mit Kommentaren für den Agreement-Check
+        min_agreement: Schwellwert (wird nur zur Information mitgespeichert)
+
+    Returns:
+        Metadata des quantisierten Models (inkl. 'agreement')
+
+    Raises:
+        ValueError: Wenn eval_file fehlt oder keine Kommentare enthält
+    """
+    model_dir = Path(model_dir)
+    target_dir = quantized_dir_for(model_dir)
+
+    comments = load_eval_comments(eval_file) if Path(eval_file).exists() else []
+    if not comments:
+        # Ohne Agreement-Check kein int8-Model - sonst würde 0% Agreement gespeichert
+        raise ValueError(
+            f"Keine Evaluations-Kommentare gefunden ({eval_file}) - "
+            f"Agreement-Check nicht möglich, --eval-file angeben"
+        )
+
+    tokenizer = AutoTokenizer.from_pretrained(str(model_dir), local_files_only=True)
+    model = AutoModelForSequenceClassification.from_pretrained(str(model_dir), local_files_only=True)
+    model.eval()
+
+    start = time.time()
+    reference = predict_labels(model, tokenizer, comments)
+    fp32_time = time.time() - start
+
+    quantized = quantize_dynamic_int8(model)
+
+    start = time.time()
+    candidate = predict_labels(quantized, tokenizer, comments)
+    int8_time = time.time() - start
+
+    agreement = label_agreement(reference, candidate)
+
+    info = {
+        'source_model': str(model_dir.name),
+        'source_signature': source_signature(model_dir),
+        'dtype': 'qint8',
+        'quantized_modules': ['Linear'],
+        'eval_file': Path(eval_file).name,
+        'eval_samples': len(comments),
+        'agreement': round(agreement, 4),
+        'min_agreement_at_build': min_agreement,
+        'fp32_eval_seconds': round(fp32_time, 3),
+        'int8_eval_seconds': round(int8_time, 3),
+    }
+    save_quantized(quantized, target_dir, info)
+
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Erstellt int8-quantisiertes Sentiment-Model')
+    parser.add_argument('--model-dir', type=str, default=str(DEFAULT_MODEL_DIR),
+                        help='Verzeichnis des fp32 Sentiment-Models')
+    parser.add_argument('--eval-file', type=str, default=str(DEFAULT_EVAL_FILE),
+                        help='Artikel-JSON mit Kommentaren für den Agreement-Check')
+    parser.add_argument('--min-agreement', type=float, default=DEFAULT_MIN_AGREEMENT,
+                        help=f'Minimale Label-Übereinstimmung mit fp32 (default: {DEFAULT_MIN_AGREEMENT})')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("  INT8-QUANTISIERUNG SENTIMENT MODEL")
+    print("=" * 70)
+    print(f"\nModel: {args.model_dir}")
+    print(f"Ziel:  {quantized_dir_for(Path(args.model_dir))}")
+
+    try:
+        info = build_quantized_sentiment_model(
+            Path(args.model_dir),
+            Path(args.eval_file),
+            args.min_agreement
+        )
+    except ValueError as e:
+        print(f"\n✗ {e}")
+        return False
+
+    print(f"\nEvaluations-Kommentare: {info['eval_samples']}")
+    print(f"Label-Agreement int8 vs fp32: {info['agreement']:.1%}")
+    print(f"Laufzeit fp32: {info['fp32_eval_seconds']:.2f}s | int8: {info['int8_eval_seconds']:.2f}s")
+
+    if info['agreement'] >= args.min_agreement:
+        print(f"\n✓ int8-Model akzeptiert (≥ {args.min_agreement:.1%})")
+        return True
+
+    print(f"\n✗ int8-Model abgelehnt (< {args.min_agreement:.1%}) - Analyzer verwendet weiterhin fp32")
+    return False
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n✗ Fehler: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,160 @@
+"""
+Persistenter Ergebnis-Cache (SQLite)
+Speichert Model-Ergebnisse content-adressiert auf Disk, damit wiederholte
+Läufe auf überlappenden Exporten nicht alles neu berechnen müssen.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# SQLite erlaubt max. 999 Parameter pro Statement (ältere Versionen)
+_SQL_CHUNK_SIZE = 500
+
+
+def normalize_text(text: str) -> str:
+    """Normalisiert Text für Cache-Keys (Unicode NFC, Whitespace zusammengefasst)"""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+def make_key(*parts: str) -> str:
+    """Erstellt einen SHA-256 Cache-Key aus mehreren Bestandteilen"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Key/Value Cache auf SQLite-Basis mit LRU-Eviction
+
+    Werte werden als JSON gespeichert. Jeder Treffer aktualisiert den
+    Zugriffszeitpunkt; wird max_entries überschritten, werden die am
+    längsten nicht genutzten Einträge gelöscht.
+    """
+
+    def __init__(self, db_path: str, max_entries: int = 200000):
+        """
+        Öffnet (oder erstellt) den Cache
+
+        Args:
+            db_path: Pfad zur SQLite-Datei
+            max_entries: Maximale Anzahl Einträge (LRU-Eviction darüber)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_results_last_access ON results(last_access)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict]:
+        """
+        Liest mehrere Einträge und zählt Hits/Misses
+
+        Args:
+            keys: Cache-Keys
+
+        Returns:
+            Dictionary key → Wert (nur Treffer)
+        """
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        for start in range(0, len(unique_keys), _SQL_CHUNK_SIZE):
+            chunk = unique_keys[start:start + _SQL_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, value FROM results WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            for key, value in rows:
+                found[key] = json.loads(value)
+
+        if found:
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE results SET last_access = ? WHERE key = ?",
+                [(now, key) for key in found]
+            )
+            self._conn.commit()
+
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Liest einen einzelnen Eintrag (None bei Miss)"""
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: Dict[str, Dict]):
+        """
+        Schreibt mehrere Einträge und wendet danach die Größenbegrenzung an
+
+        Args:
+            items: Dictionary key → Wert (JSON-serialisierbar)
+        """
+        if not items:
+            return
+
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO results (key, value, last_access) VALUES (?, ?, ?)",
+            [(key, json.dumps(value, ensure_ascii=False), now) for key, value in items.items()]
+        )
+        self._evict()
+        self._conn.commit()
+
+    def put(self, key: str, value: Dict):
+        """Schreibt einen einzelnen Eintrag"""
+        self.put_many({key: value})
+
+    def _evict(self):
+        """Löscht die am längsten nicht genutzten Einträge über max_entries"""
+        count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM results WHERE key IN ("
+                "SELECT key FROM results ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            )
+            self.evictions += overflow
+            logger.info(f"Cache: {overflow} Einträge entfernt (LRU, max={self.max_entries})")
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get_stats(self) -> Dict:
+        """Gibt Hit/Miss-Statistik zurück"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self),
+            'path': str(self.db_path),
+        }
+
+    def close(self):
+        """Schließt die Datenbankverbindung"""
+        self._conn.close()
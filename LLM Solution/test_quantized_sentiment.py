@@ -0,0 +1,103 @@
+"""
+Regressionstest: int8 Sentiment-Model aus bestehendem Cache-Verzeichnis laden
+
+Baut ein winziges BERT-Model, legt die int8-Variante wie quantize_sentiment_model.py
+im "-int8" Verzeichnis ab und prüft, dass ein zweiter Start mit quantize=True das
+gecachte Model im Transformer-Pfad verwendet (kein Lexikon-Fallback).
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Füge aktuelles Verzeichnis zum Path hinzu
+sys.path.insert(0, str(Path(__file__).parent))
+
+# torch vor transformers importieren: torch.save sucht beim Pickling der
+# int8-Gewichte in sys.modules und würde sonst Lazy-Module von transformers laden
+try:
+    import torch
+except ImportError:
+    pass
+
+from offline_sentiment_analyzer import OfflineSentimentAnalyzer, TRANSFORMERS_AVAILABLE
+
+
+def print_section(title: str):
+    """Druckt Section-Header"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def build_tiny_model(model_dir: Path):
+    """Speichert ein zufällig initialisiertes Mini-BERT (5 Sterne-Labels) mit Tokenizer"""
+    import torch
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+
+    model_dir.mkdir(parents=True)
+    words = ["great", "good", "bad", "terrible", "article", "service", "very", "not"]
+    vocab_file = model_dir / "vocab.txt"
+    vocab_file.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + words) + "\n", encoding="utf-8")
+    BertTokenizerFast(vocab_file=str(vocab_file)).save_pretrained(str(model_dir))
+
+    config = BertConfig(
+        vocab_size=len(words) + 5, hidden_size=32, num_hidden_layers=1, num_attention_heads=2,
+        intermediate_size=64, max_position_embeddings=64, num_labels=5,
+        id2label={i: f"{i + 1} stars" for i in range(5)},
+        label2id={f"{i + 1} stars": i for i in range(5)}
+    )
+    torch.manual_seed(0)
+    BertForSequenceClassification(config).save_pretrained(str(model_dir))
+
+
+def build_int8_cache(model_dir: Path):
+    """Legt die int8-Variante ab (wie build_quantized_sentiment_model, ohne Eval-Datei)"""
+    from transformers import AutoModelForSequenceClassification
+    from quantization import quantize_dynamic_int8, quantized_dir_for, save_quantized
+    from model_utils import source_signature
+
+    model = AutoModelForSequenceClassification.from_pretrained(str(model_dir), local_files_only=True)
+    model.eval()
+    info = {
+        'source_model': model_dir.name,
+        'source_signature': source_signature(model_dir),
+        'dtype': 'qint8',
+        'quantized_modules': ['Linear'],
+        'eval_samples': 0,
+        'agreement': 1.0,
+    }
+    save_quantized(quantize_dynamic_int8(model), quantized_dir_for(model_dir), info)
+
+
+def test_int8_from_existing_cache() -> bool:
+    """Zweiter Lauf mit vorhandenem -int8 Verzeichnis muss das int8-Model laden"""
+    print_section("TEST: int8 Model aus bestehendem Cache")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir = Path(tmp) / "sentiment-tiny"
+        build_tiny_model(model_dir)
+        build_int8_cache(model_dir)
+
+        analyzer = OfflineSentimentAnalyzer(
+            model_dir=str(model_dir),
+            fallback_to_lexicon=True,
+            quantize=True,
+            quantize_min_agreement=0.5
+        )
+        try:
+            result = analyzer.analyze("very good service")
+        finally:
+            analyzer.close()
+
+    ok = analyzer.mode == 'bert' and analyzer.precision == 'int8' and result['mode'] == 'bert'
+    print(f"  Mode: {analyzer.mode}, Präzision: {analyzer.precision}, Ergebnis: {result['category']}")
+    print(f"{'✓' if ok else '✗'} Transformer-Pfad mit int8-Model{'' if ok else ' NICHT'} verwendet")
+    return ok
+
+
+if __name__ == "__main__":
+    if not TRANSFORMERS_AVAILABLE:
+        print("⚠️  transformers/torch nicht installiert - Test übersprungen")
+        sys.exit(0)
+    sys.exit(0 if test_int8_from_existing_cache() else 1)
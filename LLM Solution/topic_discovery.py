@@ -16,21 +16,62 @@ Unsupervised is useful when:
 """
 
 import logging
-from typing import Dict, List, Tuple
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
 import re
 from collections import Counter
-import math
+
+import numpy as np
+from scipy import sparse
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Above this many documents the silhouette score is estimated on a random sample
+SILHOUETTE_SAMPLE_SIZE = 2000
+
+# Per-process state of the k-sweep workers (set once by _init_sweep_worker)
+_sweep_worker_state: Dict = {}
+
+
+def _init_sweep_worker(shared_dir: str, shape: Tuple[int, int], has_similarity: bool):
+    """Initializes a k-sweep worker: maps the shared TF-IDF arrays read-only"""
+    def load(name):
+        return np.load(os.path.join(shared_dir, f"{name}.npy"), mmap_mode='r')
+
+    _sweep_worker_state['vectors'] = sparse.csr_matrix(
+        (load('data'), load('indices'), load('indptr')), shape=shape, copy=False
+    )
+    _sweep_worker_state['similarity'] = load('similarity') if has_similarity else None
+    _sweep_worker_state['discoverer'] = TopicDiscovery()
+
+
+def _evaluate_k_in_worker(task: Tuple[int, int, int]) -> Dict:
+    """Evaluates one k in a worker process (see TopicDiscovery._evaluate_k)"""
+    k, n_restarts, seed = task
+    return _sweep_worker_state['discoverer']._evaluate_k(
+        _sweep_worker_state['vectors'], k, n_restarts, seed, _sweep_worker_state['similarity']
+    )
+
 
 class TopicDiscovery:
     """
     Discovers topics automatically from article text using TF-IDF and clustering
     """
 
-    def __init__(self, num_topics: int = 10, min_articles_per_topic: int = 2, auto_optimize: bool = False):
+    def __init__(
+        self,
+        num_topics: int = 10,
+        min_articles_per_topic: int = 2,
+        auto_optimize: bool = False,
+        random_state: Optional[int] = None,
+        n_jobs: int = 1,
+        n_restarts: int = 3,
+        sweep_patience: Optional[int] = 2
+    ):
         """
         Initialize topic discovery
 
@@ -38,10 +79,19 @@ class TopicDiscovery:
             num_topics: Target number of topics to discover (ignored if auto_optimize=True)
             min_articles_per_topic: Minimum articles needed to form a topic
             auto_optimize: Automatically determine optimal number of clusters using Silhouette score
+            random_state: Seed for k-means++ initialization and silhouette sampling (None = random)
+            n_jobs: Worker processes for the k-sweep (1 = sequential, -1 = all CPUs)
+            n_restarts: K-means restarts per k during the sweep (best silhouette is kept)
+            sweep_patience: Stop the sweep after this many consecutive k with falling
+                            silhouette score (None = always test every k)
         """
         self.num_topics = num_topics
         self.min_articles_per_topic = min_articles_per_topic
         self.auto_optimize = auto_optimize
+        self.n_jobs = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+        self.n_restarts = max(1, n_restarts)
+        self.sweep_patience = sweep_patience
+        self.rng = np.random.default_rng(random_state)
         self.stopwords = self._load_stopwords()
 
     def _load_stopwords(self) -> set:
@@ -117,149 +167,143 @@ class TopicDiscovery:
 
         return tokens
 
-    def _compute_tfidf(self, documents: List[List[str]]) -> Tuple[List[Dict[str, float]], List[str]]:
+    def _compute_tfidf(self, documents: List[List[str]]) -> Tuple[sparse.csr_matrix, List[str]]:
         """
         Compute TF-IDF scores for documents
 
+        Builds a sparse document-term matrix in a single pass over the tokens
+        (TF = count / document length, IDF = log(N / df)). Only non-zero
+        entries are stored.
+
         Args:
             documents: List of tokenized documents
 
         Returns:
-            Tuple of (TF-IDF vectors, vocabulary)
+            Tuple of (TF-IDF matrix [num_docs, vocab_size] in CSR format, vocabulary)
         """
-        # Build vocabulary
-        vocab = set()
+        # Map tokens to ids while walking the documents once
+        token_ids = {}
+        indices = []
+        indptr = [0]
         for doc in documents:
-            vocab.update(doc)
-        vocab = sorted(list(vocab))
-
-        # Compute document frequency
-        df = {}
-        num_docs = len(documents)
-
-        for word in vocab:
-            df[word] = sum(1 for doc in documents if word in doc)
-
-        # Compute TF-IDF for each document
-        tfidf_vectors = []
+            indices.extend(token_ids.setdefault(token, len(token_ids)) for token in doc)
+            indptr.append(len(indices))
 
-        for doc in documents:
-            # Term frequency
-            tf = Counter(doc)
-            total_terms = len(doc)
+        # Sorted vocabulary (column order), remap ids accordingly
+        vocab = sorted(token_ids)
+        remap = np.empty(len(vocab), dtype=np.int64)
+        remap[[token_ids[word] for word in vocab]] = np.arange(len(vocab))
 
-            # TF-IDF vector
-            vector = {}
-            for word in vocab:
-                if word in tf:
-                    # TF: frequency / total terms
-                    tf_score = tf[word] / total_terms if total_terms > 0 else 0
+        num_docs = len(documents)
+        indices = remap[np.asarray(indices, dtype=np.int64)] if indices else np.zeros(0, dtype=np.int64)
+        counts = sparse.csr_matrix(
+            (np.ones(len(indices)), indices, np.asarray(indptr)),
+            shape=(num_docs, len(vocab))
+        )
+        counts.sum_duplicates()
 
-                    # IDF: log(N / df)
-                    idf_score = math.log(num_docs / df[word]) if df[word] > 0 else 0
+        # Document frequency: number of documents containing each word
+        df = np.bincount(counts.indices, minlength=len(vocab))
+        idf = np.log(num_docs / np.maximum(df, 1))
 
-                    # TF-IDF
-                    vector[word] = tf_score * idf_score
-                else:
-                    vector[word] = 0.0
+        # TF: frequency / total terms
+        doc_lengths = np.diff(np.asarray(indptr))
+        row_lengths = np.repeat(doc_lengths, np.diff(counts.indptr))
 
-            tfidf_vectors.append(vector)
+        tfidf = counts.copy()
+        tfidf.data = counts.data / row_lengths * idf[counts.indices]
 
-        return tfidf_vectors, vocab
+        return tfidf, vocab
 
-    def _cosine_similarity(self, vec1: Dict[str, float], vec2: Dict[str, float]) -> float:
+    def _normalize_rows(self, matrix: sparse.csr_matrix) -> sparse.csr_matrix:
         """
-        Compute cosine similarity between two TF-IDF vectors
+        L2-normalize each row so that dot products are cosine similarities
 
         Args:
-            vec1: First vector
-            vec2: Second vector
+            matrix: TF-IDF matrix
 
         Returns:
-            Cosine similarity score (0-1)
+            Row-normalized copy (all-zero rows stay zero)
         """
-        # Dot product
-        dot_product = sum(vec1.get(k, 0) * vec2.get(k, 0) for k in set(vec1.keys()) | set(vec2.keys()))
-
-        # Magnitudes
-        mag1 = math.sqrt(sum(v ** 2 for v in vec1.values()))
-        mag2 = math.sqrt(sum(v ** 2 for v in vec2.values()))
-
-        if mag1 == 0 or mag2 == 0:
-            return 0.0
-
-        return dot_product / (mag1 * mag2)
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        scale = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+        return sparse.csr_matrix(sparse.diags(scale) @ matrix)
 
     def _simple_kmeans(
         self,
-        vectors: List[Dict[str, float]],
+        vectors: sparse.csr_matrix,
         k: int,
-        max_iterations: int = 50
+        max_iterations: int = 50,
+        rng: Optional[np.random.Generator] = None
     ) -> List[int]:
         """
-        Simple K-Means clustering implementation
+        Spherical K-Means clustering (cosine similarity)
+
+        Uses k-means++ initialization and one sparse matrix product per
+        iteration to compare all documents with all centroids.
 
         Args:
-            vectors: TF-IDF vectors
+            vectors: L2-normalized TF-IDF matrix (see _normalize_rows)
             k: Number of clusters
             max_iterations: Maximum iterations
+            rng: Random generator for the initialization (default: self.rng)
 
         Returns:
             List of cluster assignments
         """
-        import random
-
-        if len(vectors) < k:
+        rng = rng or self.rng
+        n = vectors.shape[0]
+        if n < k:
             # Not enough documents for k clusters
-            return list(range(len(vectors)))
+            return list(range(n))
+
+        # k-means++: next centroid drawn proportional to squared cosine distance
+        chosen = [int(rng.integers(n))]
+        closest_distance = 1.0 - (vectors @ vectors[chosen[0]].T).toarray().ravel()
+        for _ in range(1, k):
+            weights = np.clip(closest_distance, 0.0, None) ** 2
+            if weights.sum() > 0:
+                candidate = int(rng.choice(n, p=weights / weights.sum()))
+            else:
+                candidate = int(rng.choice(np.setdiff1d(np.arange(n), chosen)))
+            chosen.append(candidate)
+            distance = 1.0 - (vectors @ vectors[candidate].T).toarray().ravel()
+            closest_distance = np.minimum(closest_distance, distance)
 
-        # Initialize centroids randomly
-        centroids = random.sample(vectors, k)
-        assignments = [0] * len(vectors)
+        centroids = vectors[chosen].toarray()
+        assignments = None
 
         for iteration in range(max_iterations):
-            # Assign each vector to nearest centroid
-            new_assignments = []
-            for vec in vectors:
-                similarities = [self._cosine_similarity(vec, centroid) for centroid in centroids]
-                cluster = similarities.index(max(similarities))
-                new_assignments.append(cluster)
+            # Assign each vector to nearest centroid (one matmul for all pairs)
+            new_assignments = np.asarray(vectors @ centroids.T).argmax(axis=1)
 
             # Check convergence
-            if new_assignments == assignments:
+            if assignments is not None and np.array_equal(new_assignments, assignments):
                 break
 
             assignments = new_assignments
 
-            # Update centroids (mean of assigned vectors)
-            new_centroids = []
-            for cluster_id in range(k):
-                cluster_vecs = [vectors[i] for i, c in enumerate(assignments) if c == cluster_id]
-
-                if not cluster_vecs:
-                    # Empty cluster, keep old centroid
-                    new_centroids.append(centroids[cluster_id])
-                    continue
-
-                # Average all vectors in cluster
-                avg_vector = {}
-                vocab = set()
-                for vec in cluster_vecs:
-                    vocab.update(vec.keys())
-
-                for word in vocab:
-                    avg_vector[word] = sum(vec.get(word, 0) for vec in cluster_vecs) / len(cluster_vecs)
-
-                new_centroids.append(avg_vector)
+            # Update centroids: normalized mean of assigned vectors
+            membership = sparse.csr_matrix(
+                (np.ones(n), (assignments, np.arange(n))), shape=(k, n)
+            )
+            sums = np.asarray((membership @ vectors).todense())
+            norms = np.linalg.norm(sums, axis=1)
 
-            centroids = new_centroids
+            # Empty cluster (or only empty documents): keep old centroid
+            keep = norms == 0
+            sums[keep] = centroids[keep]
+            norms[keep] = 1.0
+            centroids = sums / norms[:, None]
 
-        return assignments
+        return assignments.tolist()
 
     def _calculate_silhouette_score(
         self,
-        vectors: List[Dict[str, float]],
-        assignments: List[int]
+        vectors: sparse.csr_matrix,
+        assignments: List[int],
+        similarity: Optional[np.ndarray] = None,
+        rng: Optional[np.random.Generator] = None
     ) -> float:
         """
         Calculate Silhouette score for clustering quality
@@ -269,106 +313,241 @@ class TopicDiscovery:
         - 0: Overlapping clusters
         - -1: Wrong clustering (samples closer to other clusters)
 
+        Distances are 1 - cosine similarity. Per-cluster mean distances come
+        from one product with a cluster membership matrix. Above
+        SILHOUETTE_SAMPLE_SIZE documents the score is estimated on a random
+        sample of documents (distances to all documents).
+
         Args:
-            vectors: TF-IDF vectors
+            vectors: L2-normalized TF-IDF matrix
             assignments: Cluster assignments
+            similarity: Optional precomputed similarity matrix (vectors @ vectors.T),
+                        reused across calls with different assignments
+            rng: Random generator for sampling (default: self.rng)
 
         Returns:
             Average Silhouette score
         """
-        n = len(vectors)
+        n = vectors.shape[0]
         if n == 0:
             return 0.0
 
-        silhouette_scores = []
+        labels = np.asarray(assignments)
+        clusters, labels = np.unique(labels, return_inverse=True)
+        if len(clusters) < 2:
+            # Only one cluster
+            return 0.0
 
-        for i in range(n):
-            # Current cluster
-            cluster_i = assignments[i]
+        rows = np.arange(n)
+        if similarity is not None:
+            distances = 1.0 - similarity
+        else:
+            if n > SILHOUETTE_SAMPLE_SIZE:
+                rows = np.sort((rng or self.rng).choice(n, size=SILHOUETTE_SAMPLE_SIZE, replace=False))
+            distances = 1.0 - np.asarray((vectors[rows] @ vectors.T).todense())
 
-            # a(i): Average distance to points in same cluster
-            same_cluster_indices = [j for j in range(n) if assignments[j] == cluster_i and j != i]
+        # Sum of distances from each evaluated point to every cluster
+        membership = sparse.csr_matrix(
+            (np.ones(n), (np.arange(n), labels)), shape=(n, len(clusters))
+        )
+        cluster_sums = np.asarray(distances @ membership)
+        cluster_sizes = np.bincount(labels, minlength=len(clusters)).astype(float)
 
-            if not same_cluster_indices:
-                # Only point in cluster
-                silhouette_scores.append(0.0)
-                continue
+        own = labels[rows]
+        own_size = cluster_sizes[own] - 1
+        point_index = np.arange(len(rows))
 
-            a_i = sum(
-                1 - self._cosine_similarity(vectors[i], vectors[j])  # Distance = 1 - similarity
-                for j in same_cluster_indices
-            ) / len(same_cluster_indices)
+        # a(i): Average distance to other points in same cluster (excluding i itself)
+        own_sum = cluster_sums[point_index, own] - distances[point_index, rows]
+        a = np.divide(own_sum, own_size, out=np.zeros_like(own_sum), where=own_size > 0)
 
-            # b(i): Minimum average distance to points in other clusters
-            other_clusters = set(assignments) - {cluster_i}
+        # b(i): Minimum average distance to points in other clusters
+        mean_to_clusters = cluster_sums / cluster_sizes
+        mean_to_clusters[point_index, own] = np.inf
+        b = mean_to_clusters.min(axis=1)
 
-            if not other_clusters:
-                # Only one cluster
-                silhouette_scores.append(0.0)
-                continue
+        denominator = np.maximum(a, b)
+        scores = np.divide(b - a, denominator, out=np.zeros_like(a), where=denominator > 0)
+
+        # Only point in cluster
+        scores[own_size == 0] = 0.0
+
+        return float(scores.mean())
 
-            b_i = float('inf')
-            for other_cluster in other_clusters:
-                other_cluster_indices = [j for j in range(n) if assignments[j] == other_cluster]
+    def _evaluate_k(
+        self,
+        vectors: sparse.csr_matrix,
+        k: int,
+        n_restarts: int,
+        seed: int,
+        similarity: Optional[np.ndarray] = None
+    ) -> Dict:
+        """
+        Clusters with k clusters n_restarts times and keeps the best Silhouette score
 
-                if other_cluster_indices:
-                    avg_dist = sum(
-                        1 - self._cosine_similarity(vectors[i], vectors[j])
-                        for j in other_cluster_indices
-                    ) / len(other_cluster_indices)
+        The random generator is derived from (seed, k), so the result does not
+        depend on whether k is evaluated in this process or in a worker.
+
+        Args:
+            vectors: L2-normalized TF-IDF matrix
+            k: Number of clusters
+            n_restarts: Number of k-means runs with different initializations
+            seed: Base seed of the sweep
+            similarity: Optional precomputed similarity matrix
 
-                    b_i = min(b_i, avg_dist)
+        Returns:
+            Dict with k, silhouette, assignments, restarts and seconds
+        """
+        start = time.perf_counter()
+        rng = np.random.default_rng([seed, k])
 
-            # Silhouette score for point i
-            s_i = (b_i - a_i) / max(a_i, b_i) if max(a_i, b_i) > 0 else 0
-            silhouette_scores.append(s_i)
+        best_score, best_assignments = None, None
+        for _ in range(n_restarts):
+            assignments = self._simple_kmeans(vectors, k, rng=rng)
+            score = self._calculate_silhouette_score(vectors, assignments, similarity, rng=rng)
+            if best_score is None or score > best_score:
+                best_score, best_assignments = score, assignments
 
-        return sum(silhouette_scores) / len(silhouette_scores) if silhouette_scores else 0.0
+        return {
+            'k': k,
+            'silhouette': best_score,
+            'assignments': best_assignments,
+            'restarts': n_restarts,
+            'seconds': time.perf_counter() - start,
+        }
 
     def _find_optimal_clusters(
         self,
-        vectors: List[Dict[str, float]],
+        vectors: sparse.csr_matrix,
         min_k: int = 2,
         max_k: int = 10
-    ) -> Tuple[int, Dict[int, float]]:
+    ) -> Tuple[int, Dict[int, Dict], List[int]]:
         """
         Find optimal number of clusters using Silhouette score
 
+        Each k gets n_restarts k-means runs. With n_jobs > 1 the k values are
+        evaluated in worker processes, n_jobs at a time; the TF-IDF matrix is
+        shared read-only through memory-mapped files instead of being pickled
+        per task. The sweep stops early once the score has fallen for
+        sweep_patience consecutive k.
+
         Args:
-            vectors: TF-IDF vectors
+            vectors: L2-normalized TF-IDF matrix
             min_k: Minimum number of clusters to try (default: 2)
             max_k: Maximum number of clusters to try (default: 10)
 
         Returns:
-            Tuple of (optimal_k, silhouette_scores_dict)
+            Tuple of (optimal_k, per-k results {k: {silhouette, restarts, seconds}},
+            assignments of the best run for optimal_k)
         """
-        n = len(vectors)
+        n = vectors.shape[0]
 
         # Adjust max_k based on number of documents
         max_k = min(max_k, n // 3)  # At least 3 docs per cluster on average
         max_k = max(max_k, min_k)  # Ensure max_k >= min_k
 
-        logger.info(f"Finding optimal cluster count (testing k={min_k} to k={max_k})...")
+        k_values = list(range(min_k, max_k + 1))
+        n_jobs = min(self.n_jobs, len(k_values))
+        logger.info(
+            f"Finding optimal cluster count (testing k={min_k} to k={max_k}, "
+            f"{self.n_restarts} restarts per k, {n_jobs} worker(s))..."
+        )
+        sweep_start = time.perf_counter()
+
+        # Similarity matrix once for all k (small corpora), otherwise sampled per k
+        similarity = None
+        if n <= SILHOUETTE_SAMPLE_SIZE:
+            similarity = np.asarray((vectors @ vectors.T).todense())
+
+        seed = int(self.rng.integers(2**31))
+        if n_jobs > 1:
+            results = self._sweep_parallel(vectors, k_values, seed, similarity, n_jobs)
+        else:
+            results = []
+            for k in k_values:
+                results.append(self._evaluate_k(vectors, k, self.n_restarts, seed, similarity))
+                if self._sweep_should_stop(results):
+                    break
+
+        k_sweep = {}
+        for result in results:
+            k_sweep[result['k']] = {
+                'silhouette': result['silhouette'],
+                'restarts': result['restarts'],
+                'seconds': round(result['seconds'], 3),
+            }
+            logger.info(
+                f"  k={result['k']}: Silhouette score = {result['silhouette']:.3f} "
+                f"({result['seconds']:.2f}s)"
+            )
 
-        silhouette_scores = {}
+        if len(results) < len(k_values):
+            logger.info(f"  Stopped after k={results[-1]['k']} (Silhouette score falling)")
 
-        for k in range(min_k, max_k + 1):
-            # Cluster with k clusters
-            assignments = self._simple_kmeans(vectors, k)
+        # Find k with highest Silhouette score
+        best = max(results, key=lambda result: result['silhouette'])
+        optimal_k = best['k']
 
-            # Calculate Silhouette score
-            score = self._calculate_silhouette_score(vectors, assignments)
-            silhouette_scores[k] = score
+        logger.info(
+            f"✓ Optimal cluster count: k={optimal_k} (Silhouette score: {best['silhouette']:.3f}, "
+            f"sweep {time.perf_counter() - sweep_start:.2f}s)"
+        )
 
-            logger.info(f"  k={k}: Silhouette score = {score:.3f}")
+        return optimal_k, k_sweep, best['assignments']
 
-        # Find k with highest Silhouette score
-        optimal_k = max(silhouette_scores.items(), key=lambda x: x[1])[0]
-        best_score = silhouette_scores[optimal_k]
+    def _sweep_should_stop(self, results: List[Dict]) -> bool:
+        """True if the Silhouette score fell for sweep_patience consecutive k"""
+        if not self.sweep_patience or len(results) <= self.sweep_patience:
+            return False
+        recent = [result['silhouette'] for result in results[-(self.sweep_patience + 1):]]
+        return all(later < earlier for earlier, later in zip(recent, recent[1:]))
 
-        logger.info(f"✓ Optimal cluster count: k={optimal_k} (Silhouette score: {best_score:.3f})")
+    def _sweep_parallel(
+        self,
+        vectors: sparse.csr_matrix,
+        k_values: List[int],
+        seed: int,
+        similarity: Optional[np.ndarray],
+        n_jobs: int
+    ) -> List[Dict]:
+        """
+        Evaluates k values in worker processes (n_jobs at a time)
 
-        return optimal_k, silhouette_scores
+        The CSR arrays (and the similarity matrix, if any) are written once to
+        a temporary directory; every worker maps them read-only. Results are
+        checked in k order after each round, so early stopping gives the same
+        result as the sequential sweep.
+        """
+        results = []
+        with tempfile.TemporaryDirectory(prefix="topic_sweep_") as shared_dir:
+            np.save(os.path.join(shared_dir, "data.npy"), vectors.data)
+            np.save(os.path.join(shared_dir, "indices.npy"), vectors.indices)
+            np.save(os.path.join(shared_dir, "indptr.npy"), vectors.indptr)
+            if similarity is not None:
+                np.save(os.path.join(shared_dir, "similarity.npy"), similarity)
+
+            pool = multiprocessing.get_context('spawn').Pool(
+                processes=n_jobs,
+                initializer=_init_sweep_worker,
+                initargs=(shared_dir, vectors.shape, similarity is not None)
+            )
+            try:
+                for start in range(0, len(k_values), n_jobs):
+                    tasks = [(k, self.n_restarts, seed) for k in k_values[start:start + n_jobs]]
+                    stopped = False
+                    for result in pool.map(_evaluate_k_in_worker, tasks):
+                        results.append(result)
+                        if self._sweep_should_stop(results):
+                            stopped = True
+                            break
+                    if stopped:
+                        break
+            finally:
+                # Workers must release the memory maps before the directory is removed
+                pool.close()
+                pool.join()
+
+        return results
 
     def discover_topics(
         self,
@@ -396,23 +575,26 @@ class TopicDiscovery:
 
         # Compute TF-IDF
         logger.info("Computing TF-IDF vectors...")
-        tfidf_vectors, vocab = self._compute_tfidf(documents)
+        tfidf_matrix, vocab = self._compute_tfidf(documents)
+        tfidf_vectors = self._normalize_rows(tfidf_matrix)
 
         # Determine optimal number of clusters if auto_optimize enabled
         if self.auto_optimize:
-            optimal_k, silhouette_scores = self._find_optimal_clusters(
+            optimal_k, k_sweep, cluster_assignments = self._find_optimal_clusters(
                 tfidf_vectors,
                 min_k=max(2, self.min_articles_per_topic),
                 max_k=min(10, len(articles) // 3)  # Changed from 20 to 10 for faster optimization
             )
             num_topics = optimal_k
+            silhouette_scores = {k: result['silhouette'] for k, result in k_sweep.items()}
         else:
             num_topics = self.num_topics
+            k_sweep = {}
             silhouette_scores = {}
 
-        # Cluster with K-Means
-        logger.info(f"Clustering into {num_topics} topics...")
-        cluster_assignments = self._simple_kmeans(tfidf_vectors, num_topics)
+            # Cluster with K-Means
+            logger.info(f"Clustering into {num_topics} topics...")
+            cluster_assignments = self._simple_kmeans(tfidf_vectors, num_topics)
 
         # Calculate final Silhouette score
         final_silhouette = self._calculate_silhouette_score(tfidf_vectors, cluster_assignments)
@@ -431,15 +613,11 @@ class TopicDiscovery:
                 continue
 
             # Average TF-IDF scores across cluster
-            avg_tfidf = {}
-            for word in vocab:
-                avg_tfidf[word] = sum(
-                    tfidf_vectors[i][word] for i in cluster_indices
-                ) / len(cluster_indices)
+            avg_tfidf = np.asarray(tfidf_matrix[cluster_indices].mean(axis=0)).ravel()
 
-            # Top 5 keywords for this topic
-            top_words = sorted(avg_tfidf.items(), key=lambda x: x[1], reverse=True)[:5]
-            topic_keywords[topic_id] = [word for word, score in top_words]
+            # Top 5 keywords for this topic (stable: ties keep vocabulary order)
+            top_ids = np.argsort(-avg_tfidf, kind='stable')[:5]
+            topic_keywords[topic_id] = [vocab[i] for i in top_ids]
 
         # Generate topic names from keywords
         topic_names = {}
@@ -470,7 +648,8 @@ class TopicDiscovery:
             'valid_topics': valid_topics,
             'num_topics': num_topics,
             'silhouette_score': final_silhouette,
-            'silhouette_scores_by_k': silhouette_scores if self.auto_optimize else {},
+            'silhouette_scores_by_k': silhouette_scores,
+            'k_sweep': k_sweep,
         }
 
     def get_topic_sentiment_analysis(
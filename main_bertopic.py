@@ -7,17 +7,18 @@ Verwendung:
 """
 
 import argparse
+import importlib
+import importlib.util
 import logging
 import sys
 import json
 from pathlib import Path
-import pandas as pd
 from datetime import datetime
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-import re
 import time
-from typing import Dict, Any
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List
 
 # Try to import tqdm for progress bars
 try:
@@ -32,52 +33,175 @@ except ImportError:
 # Add LLM Solution to path
 sys.path.insert(0, str(Path(__file__).parent / "LLM Solution"))
 
-# Try to import BERTopic
+# BERTopic, sentence-transformers, torch/transformers (Sentiment, mBART), sklearn und pandas
+# werden erst in den Schritten importiert, die sie brauchen (_timed_import), damit --help und
+# die Eingabeprüfung ohne Model-Imports auskommen
+BERTOPIC_AVAILABLE = (
+    importlib.util.find_spec('bertopic') is not None
+    and importlib.util.find_spec('sentence_transformers') is not None
+)
+
+# UMAP/HDBSCAN of a saved topic model (BERTopic itself is saved as safetensors)
+TOPIC_CLUSTER_MODELS_FILE = "cluster_models.joblib"
+# Format marker of a saved topic model; increase the version when the saved layout changes
+TOPIC_MODEL_FORMAT_FILE = "topic_model_format.json"
+TOPIC_MODEL_FORMAT_VERSION = 1
+
+# Try to import embedding cache (needs numpy only)
 try:
-    from bertopic import BERTopic
-    from sentence_transformers import SentenceTransformer
-    BERTOPIC_AVAILABLE = True
+    from embedding_cache import EmbeddingCache
+    from model_utils import source_signature
+    from result_cache import make_key
+    EMBEDDING_CACHE_AVAILABLE = True
 except ImportError:
-    print("❌ BERTopic nicht installiert!")
-    print("   Installiere mit: pip install bertopic sentence-transformers")
-    BERTOPIC_AVAILABLE = False
+    EMBEDDING_CACHE_AVAILABLE = False
 
-# Try to import sentiment analyzer
+# Try to import ANN index for the UMAP kNN graph (needs numpy only)
 try:
-    from offline_sentiment_analyzer import OfflineSentimentAnalyzer
-    SENTIMENT_AVAILABLE = True
+    from ann_index import IVF_INDEX_VERSION, IVFIndex
+    ANN_AVAILABLE = True
 except ImportError:
-    print("⚠️  Sentiment Analyzer nicht verfügbar")
-    SENTIMENT_AVAILABLE = False
+    ANN_AVAILABLE = False
 
-# Try to import abstractive summarizer
+# Try to import comment deduplication (needs numpy only)
 try:
-    from abstractive_summarizer import AbstractiveSummarizer
-    ABSTRACTIVE_AVAILABLE = True
+    from comment_dedup import CommentDeduplicator
+    DEDUP_AVAILABLE = True
 except ImportError:
-    ABSTRACTIVE_AVAILABLE = False
-
-# Logging configuration with file output
-log_dir = Path(__file__).parent / "logs"
-log_dir.mkdir(exist_ok=True)
-timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-log_file = log_dir / f"analysis_{timestamp}.log"
-
-logging.basicConfig(
-    level=logging.INFO,
-    handlers=[
-        logging.FileHandler(log_file, encoding='utf-8', mode='w'),  # File handler with write mode
-        logging.StreamHandler(sys.stdout)  # Console handler
-    ],
-    format='%(message)s',
-    force=True  # Force reconfiguration if already configured
-)
+    DEDUP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-# Immediately log to file to test logging works
-logger.info("=" * 70)
-logger.info(f"LOGGING INITIALIZED - File: {log_file}")
-logger.info("=" * 70)
+# Importzeit pro Modul (nur der erste Import zählt, Abhängigkeiten werden dem
+# Modul zugerechnet, das sie zuerst lädt)
+IMPORT_TIMES: Dict[str, float] = {}
+
+# Logfile des laufenden Analyse-Laufs (gesetzt von setup_logging)
+log_file = None
+
+
+def setup_logging() -> Path:
+    """
+    Log to a new file in logs/ and to the console
+
+    Called by main() after argument parsing and input validation, so importing
+    this module (spawned --sentiment-workers, tests, --help) never creates a log file.
+
+    Returns:
+        Path of the log file
+    """
+    global log_file
+    log_dir = Path(__file__).parent / "logs"
+    log_dir.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    log_file = log_dir / f"analysis_{timestamp}.log"
+
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[
+            logging.FileHandler(log_file, encoding='utf-8', mode='w'),  # File handler with write mode
+            logging.StreamHandler(sys.stdout)  # Console handler
+        ],
+        format='%(message)s',
+        force=True  # Force reconfiguration if already configured
+    )
+
+    # Immediately log to file to test logging works
+    logger.info("=" * 70)
+    logger.info(f"LOGGING INITIALIZED - File: {log_file}")
+    logger.info("=" * 70)
+    return log_file
+
+
+def _timed_import(module_name: str):
+    """
+    Import a module on first use and log how long the import took
+
+    Args:
+        module_name: Module to import (e.g. 'bertopic')
+
+    Returns:
+        The imported module
+    """
+    if module_name in IMPORT_TIMES:
+        return sys.modules[module_name]
+
+    start = time.time()
+    module = importlib.import_module(module_name)
+    IMPORT_TIMES[module_name] = time.time() - start
+    logger.info(f"   📥 Import {module_name}: {IMPORT_TIMES[module_name]:.2f}s")
+    return module
+
+
+# Ab dieser Artikelanzahl verwendet das Profil 'auto' die Large-Corpus-Einstellungen
+LARGE_CORPUS_THRESHOLD = 5000
+CLUSTERING_PROFILES = ('auto', 'small', 'large')
+
+
+def clustering_config(n_docs: int, profile: str = 'auto') -> Dict[str, Any]:
+    """
+    Choose UMAP/HDBSCAN parameters for a corpus of n_docs articles.
+
+    'small' is the original configuration tuned for < 50 articles. 'auto'
+    scales the kNN graph and the minimum cluster size with sqrt(n_docs)
+    (4 neighbors / cluster size 2 for 50 articles, 15 / 11 for 1000) and
+    switches to 'large' from LARGE_CORPUS_THRESHOLD articles on. 'large'
+    caps the kNN graph, uses UMAP's low-memory mode, parallel core distances
+    and skips the full HDBSCAN probability matrix (the most expensive part
+    of fit_transform for thousands of documents).
+
+    Args:
+        n_docs: Number of articles to cluster
+        profile: 'auto', 'small' or 'large'
+
+    Returns:
+        Dictionary with n_neighbors, n_components, min_cluster_size, min_samples,
+        low_memory, core_dist_n_jobs, calculate_probabilities and the resolved profile
+    """
+    if profile not in CLUSTERING_PROFILES:
+        raise ValueError(f"Unknown clustering profile: {profile} (allowed: {', '.join(CLUSTERING_PROFILES)})")
+
+    if profile == 'auto':
+        profile = 'large' if n_docs >= LARGE_CORPUS_THRESHOLD else 'auto'
+
+    if profile == 'small':
+        return {
+            'profile': 'small',
+            'n_neighbors': 3,
+            'n_components': 5,
+            'min_cluster_size': 2,
+            'min_samples': 1,
+            'low_memory': False,
+            'core_dist_n_jobs': 1,
+            'calculate_probabilities': True,
+        }
+
+    root = np.sqrt(max(n_docs, 1))
+    n_neighbors = int(np.clip(round(root / 2), 3, 15))
+    min_cluster_size = int(np.clip(round(root / 3), 2, 50))
+
+    if profile == 'large':
+        return {
+            'profile': 'large',
+            'n_neighbors': 15,
+            'n_components': 5,
+            'min_cluster_size': max(min_cluster_size, 25),
+            'min_samples': max(min_cluster_size // 4, 5),
+            'low_memory': True,
+            'core_dist_n_jobs': -1,
+            'calculate_probabilities': False,
+        }
+
+    return {
+        'profile': 'auto',
+        'n_neighbors': n_neighbors,
+        'n_components': 5,
+        'min_cluster_size': min_cluster_size,
+        'min_samples': max(1, min_cluster_size // 4),
+        'low_memory': False,
+        'core_dist_n_jobs': 1,
+        'calculate_probabilities': True,
+    }
 
 
 def get_sentiment_rating(score: float) -> str:
@@ -104,52 +228,172 @@ def get_sentiment_rating(score: float) -> str:
         return "❌ Very Poor"
 
 
-def extractive_summarize(text: str, embedding_model, num_sentences: int = 3) -> str:
+def encode_sentences(texts: List[str], embedding_model, batch_size: int = 64) -> Dict[str, Any]:
     """
-    Create extractive summary by selecting most representative sentences using BERT embeddings.
+    Split all texts into sentences and encode them in a single encode() call.
 
-    Uses cosine similarity between sentence embeddings to find sentences most similar
-    to the overall document embedding (document centroid).
+    SentenceTransformer.encode sorts its input by length internally, so one
+    call over the whole corpus gives evenly filled batches instead of one tiny
+    batch per article.
 
     Args:
-        text: The text to summarize
-        embedding_model: SentenceTransformer model for creating embeddings
-        num_sentences: Number of sentences to extract (default: 3)
+        texts: Texts to split (e.g. article contents)
+        embedding_model: SentenceTransformer model
+        batch_size: Sentences per forward pass
 
     Returns:
-        Summary string with selected sentences
+        Dict with 'sentences' (flat list), 'offsets' (sentences of text i are
+        sentences[offsets[i]:offsets[i + 1]]) and 'embeddings' (one row per sentence)
+    """
+    # Gleiche Satztrennung wie die mBART-Label-Prompts (abstractive_summarizer)
+    split_sentences = _timed_import('abstractive_summarizer').split_sentences
+    sentences_per_text = [split_sentences(text) if text and text.strip() else [] for text in texts]
+    counts = np.array([len(sentences) for sentences in sentences_per_text], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+    sentences = [sentence for text_sentences in sentences_per_text for sentence in text_sentences]
+
+    if sentences:
+        embeddings = np.asarray(
+            embedding_model.encode(sentences, batch_size=batch_size, show_progress_bar=False),
+            dtype=np.float32
+        )
+    else:
+        embeddings = np.zeros((0, embedding_model.get_sentence_embedding_dimension()), dtype=np.float32)
+
+    return {'sentences': sentences, 'offsets': offsets, 'embeddings': embeddings}
+
+
+def extractive_summarize_corpus(sentence_store: Dict[str, Any], num_sentences: int = 3) -> List[str]:
     """
-    if not text or not text.strip():
-        return ""
+    Extractive summaries for all texts of a sentence store (see encode_sentences).
 
-    # Split text into sentences
-    # Simple sentence splitting on common delimiters
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
-    sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 20]
+    Picks the sentences closest to their text's centroid, computed for the
+    whole corpus at once: per-text centroids are segment sums (np.add.reduceat), every
+    sentence is compared with the centroid of its own text, and the top
+    sentences per text are picked with one sort.
+
+    Args:
+        sentence_store: Result of encode_sentences
+        num_sentences: Number of sentences per summary (default: 3)
 
-    # If we have fewer sentences than requested, return all
-    if len(sentences) <= num_sentences:
-        return " ".join(sentences)
+    Returns:
+        Summary per text (sentences in original order, "" for texts without sentences)
+    """
+    sentences = sentence_store['sentences']
+    offsets = sentence_store['offsets']
+    embeddings = sentence_store['embeddings']
+
+    counts = np.diff(offsets)
+    n_texts = len(counts)
+    if not sentences:
+        return [""] * n_texts
+
+    # Document centroid = mean of its sentence embeddings (reduceat only over non-empty segments)
+    has_sentences = counts > 0
+    centroids = np.zeros((n_texts, embeddings.shape[1]), dtype=np.float32)
+    centroids[has_sentences] = (
+        np.add.reduceat(embeddings, offsets[:-1][has_sentences], axis=0) / counts[has_sentences, None]
+    )
 
-    # Create embeddings for all sentences
-    sentence_embeddings = embedding_model.encode(sentences)
+    # Cosine similarity of each sentence to the centroid of its text
+    text_ids = np.repeat(np.arange(n_texts), counts)
+    sentence_centroids = centroids[text_ids]
+    norms = np.linalg.norm(embeddings, axis=1) * np.linalg.norm(sentence_centroids, axis=1)
+    similarities = np.einsum('ij,ij->i', embeddings, sentence_centroids) / np.maximum(norms, 1e-12)
 
-    # Calculate document centroid (mean of all sentence embeddings)
-    doc_embedding = np.mean(sentence_embeddings, axis=0).reshape(1, -1)
+    # Rank within each text (most similar first); keep the top num_sentences
+    order = np.lexsort((-similarities, text_ids))
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order)) - offsets[text_ids[order]]
+    selected = np.flatnonzero(rank < num_sentences)  # ascending = original order in text
 
-    # Calculate similarity of each sentence to the document centroid
-    similarities = cosine_similarity(sentence_embeddings, doc_embedding).flatten()
+    summaries = [""] * n_texts
+    for text_id, sentence_ids in zip(*_group_by_text(text_ids[selected], selected)):
+        summaries[text_id] = " ".join(sentences[i] for i in sentence_ids)
+    return summaries
 
-    # Get indices of top N most similar sentences
-    top_indices = np.argsort(similarities)[-num_sentences:]
 
-    # Sort indices to maintain original order in text
-    top_indices = sorted(top_indices)
+def _group_by_text(text_ids: np.ndarray, values: np.ndarray):
+    """Split values (sorted by text_ids) into one group per text id"""
+    unique_ids, starts = np.unique(text_ids, return_index=True)
+    return unique_ids.tolist(), np.split(values, starts[1:])
 
-    # Extract sentences
-    summary_sentences = [sentences[i] for i in top_indices]
 
-    return " ".join(summary_sentences)
+class ModelLoader:
+    """
+    Load independent models one after another or in parallel threads
+
+    In concurrent mode all loaders start immediately in a thread pool; model
+    deserialization (safetensors, torch) is mostly disk-bound and releases the
+    GIL, so the loads overlap. In sequential mode result() runs the loader on
+    first access, so the caller keeps its original order of log output.
+    """
+
+    def __init__(self, loaders: Dict[str, Callable[[], Any]], concurrent: bool = False):
+        """
+        Args:
+            loaders: Model name → function that loads and returns the model
+            concurrent: Start all loaders at once in parallel threads
+        """
+        self.loaders = loaders
+        self.concurrent = concurrent and len(loaders) > 1
+        self.load_times: Dict[str, float] = {}
+        self.start_time = time.time()
+        self._futures = {}
+        if self.concurrent:
+            executor = ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix='model-load')
+            self._futures = {name: executor.submit(self.run, name, loader) for name, loader in loaders.items()}
+            # Keine neuen Aufgaben mehr; laufende Loader arbeiten weiter
+            executor.shutdown(wait=False)
+
+    def run(self, name: str, loader: Callable[[], Any]):
+        """Run one loader and record its load time (also used for dependent loads)"""
+        start = time.time()
+        try:
+            return loader()
+        finally:
+            self.load_times[name] = time.time() - start
+
+    def result(self, name: str):
+        """
+        Model of one loader; waits for its thread in concurrent mode
+
+        Raises the loader's exception, like a direct call would.
+        """
+        if name in self._futures:
+            return self._futures[name].result()
+        return self.run(name, self.loaders[name])
+
+    def summary(self, chains: List[List[str]]) -> Dict[str, Any]:
+        """
+        Load times and the critical path of dependent loads
+
+        Args:
+            chains: Loads that have to run one after another (e.g. the saved
+                    topic model needs the embedding model); loads not listed
+                    form a chain of their own
+
+        Returns:
+            Dictionary with load_times, total (sum), wall (since construction),
+            critical_path (names of the slowest chain) and critical_seconds
+        """
+        chained = {name for chain in chains for name in chain}
+        chains = chains + [[name] for name in self.load_times if name not in chained]
+        chain_times = [
+            ([name for name in chain if name in self.load_times],
+             sum(self.load_times.get(name, 0.0) for name in chain))
+            for chain in chains
+        ]
+        critical_path, critical_seconds = max(chain_times, key=lambda item: item[1])
+        # Reihenfolge der Loader statt Reihenfolge des Fertigwerdens
+        order = list(self.loaders) + [name for name in self.load_times if name not in self.loaders]
+        return {
+            'load_times': {name: self.load_times[name] for name in order if name in self.load_times},
+            'total': sum(self.load_times.values()),
+            'wall': time.time() - self.start_time,
+            'critical_path': critical_path,
+            'critical_seconds': critical_seconds
+        }
 
 
 class BERTopicSentimentAnalyzer:
@@ -157,13 +401,56 @@ class BERTopicSentimentAnalyzer:
     Complete sentiment analysis pipeline with BERTopic for content clustering
     """
 
-    def __init__(self, model_path: str = None, use_abstractive: bool = False):
+    def __init__(self, model_path: str = None, use_abstractive: bool = False,
+                 sentiment_batch_size: int = 32, sentiment_cache_path: str = None,
+                 sentiment_cache_size: int = 200000, near_dedup: bool = False,
+                 near_dedup_threshold: float = 0.9, sentiment_workers: int = 1,
+                 sentiment_int8: bool = False, sentiment_min_agreement: float = 0.95,
+                 sentiment_backend: str = 'torch', sentiment_window_overlap: int = 128,
+                 sentiment_window_aggregation: str = 'mean', embedding_cache_dir: str = None,
+                 topic_model_path: str = None, refit_topic_model: bool = False,
+                 clustering_profile: str = 'auto', ann_knn: bool = False, ann_probe: int = 8,
+                 label_cache_path: str = None, abstractive_precision: str = 'fp32',
+                 label_token_budget: int = 256, label_decoding: str = 'auto',
+                 generate_summaries: bool = False, concurrent_init: bool = False):
         """
         Initialize analyzer
 
         Args:
             model_path: Path to multilingual sentence transformer model
             use_abstractive: Use abstractive summarization (requires mBART model)
+            sentiment_batch_size: Number of comments per forward pass in step 4
+            sentiment_cache_path: SQLite file for the persistent sentiment cache (None = disabled)
+            sentiment_cache_size: Maximum number of cached sentiment results (LRU eviction)
+            near_dedup: Also collapse near-duplicate comments (MinHash/LSH) before scoring
+            near_dedup_threshold: Minimum shingle Jaccard similarity for near-duplicates
+            sentiment_workers: Number of worker processes for comment scoring (1 = in-process)
+            sentiment_int8: Use the int8 dynamically quantized sentiment model (built once, cached)
+            sentiment_min_agreement: Minimum int8 vs fp32 label agreement, otherwise fp32 is used
+            sentiment_backend: Inference backend for the sentiment model ('torch' or 'onnx')
+            sentiment_window_overlap: Token overlap of the windows used for comments longer than 512 tokens
+            sentiment_window_aggregation: How window predictions are combined per comment ('mean' or 'max')
+            embedding_cache_dir: Directory for the persistent article embedding cache (None = disabled)
+            topic_model_path: Directory of a saved topic model; loaded for transform-only runs if it
+                              exists, otherwise the model is fitted and saved there
+            refit_topic_model: Fit a new topic model even if topic_model_path exists (overwrites it)
+            clustering_profile: UMAP/HDBSCAN configuration: 'auto' (from corpus size at analyze() time),
+                                'small' (< 50 articles) or 'large'
+            ann_knn: Precompute UMAP's kNN graph with an IVF index over the article embeddings
+                     (kept as UMAP's search index for transform-only runs)
+            ann_probe: Number of IVF lists searched per query (higher = more exact, slower)
+            label_cache_path: SQLite file for the persistent mBART topic label cache (None = disabled)
+            abstractive_precision: mBART precision: 'fp32', 'int8' (dynamic quantization) or 'bf16'
+                                   (converted weights are cached next to the model)
+            label_token_budget: Token budget for the document part of mBART label prompts, filled with
+                                the sentences closest to the topic centroid (0/None = first 1000
+                                characters of 3 documents)
+            label_decoding: mBART label decoding: 'greedy', 'beam2', 'beam4' or 'auto' (greedy first,
+                            beam4 only for labels that fail the empty/length checks)
+            generate_summaries: Add an extractive Summary column (3 most central sentences per article);
+                                the sentence embeddings are reused for mBART label prompts
+            concurrent_init: Load the embedding, sentiment and mBART models in parallel threads
+                             (load times and the critical path are logged in self.model_load_summary)
         """
         logger.info("\n" + "=" * 70)
         logger.info("BERTopic Sentiment Analyzer - Initialisierung")
@@ -179,45 +466,89 @@ class BERTopicSentimentAnalyzer:
             logger.info("   Versuche Online-Download...")
             model_path = "paraphrase-multilingual-MiniLM-L12-v2"
 
+        # Validate early instead of failing after all models are loaded
+        if clustering_profile not in CLUSTERING_PROFILES:
+            raise ValueError(f"Unknown clustering profile: {clustering_profile} (allowed: {', '.join(CLUSTERING_PROFILES)})")
+
+        # Alle Imports im Haupt-Thread, bevor Loader in Threads starten
+        SentenceTransformer = _timed_import('sentence_transformers').SentenceTransformer
+        _timed_import('bertopic')
+        try:
+            OfflineSentimentAnalyzer = _timed_import('offline_sentiment_analyzer').OfflineSentimentAnalyzer
+        except ImportError:
+            OfflineSentimentAnalyzer = None
+        AbstractiveSummarizer = None
+        if use_abstractive:
+            try:
+                AbstractiveSummarizer = _timed_import('abstractive_summarizer').AbstractiveSummarizer
+            except ImportError:
+                AbstractiveSummarizer = None
+
+        # Unabhängige Models: Embedding, Sentiment, mBART (das gespeicherte Topic-Model braucht das Embedding-Model)
+        loaders = {'embedding_model': lambda: SentenceTransformer(str(model_path))}
+        if OfflineSentimentAnalyzer is not None:
+            loaders['sentiment'] = lambda: OfflineSentimentAnalyzer(
+                batch_size=sentiment_batch_size,
+                cache_path=sentiment_cache_path,
+                cache_max_entries=sentiment_cache_size,
+                num_workers=sentiment_workers,
+                quantize=sentiment_int8,
+                quantize_min_agreement=sentiment_min_agreement,
+                backend=sentiment_backend,
+                window_overlap=sentiment_window_overlap,
+                window_aggregation=sentiment_window_aggregation
+            )
+        if AbstractiveSummarizer is not None:
+            loaders['abstractive'] = lambda: AbstractiveSummarizer(
+                label_cache_path=label_cache_path,
+                precision=abstractive_precision,
+                prompt_token_budget=label_token_budget or None,
+                label_decoding=label_decoding
+            )
+        model_loader = ModelLoader(loaders, concurrent=concurrent_init)
+        if model_loader.concurrent:
+            logger.info(f"\n   🧵 Lade {len(loaders)} Models parallel: {', '.join(loaders)}")
+
         logger.info(f"\n[1/4] Lade Embedding Model für Article Clustering...")
         logger.info(f"   📦 Model: sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2")
         logger.info(f"   🎯 Verwendung: Semantische Embeddings für BERTopic Clustering")
         logger.info(f"   🌍 Sprachen: 50+ (multilingual)")
         logger.info(f"   📍 Path: {model_path}")
-        start_time = time.time()
-        self.embedding_model = SentenceTransformer(str(model_path))
-        load_time = time.time() - start_time
-        logger.info(f"   ✓ Geladen in {load_time:.2f}s")
+        self.embedding_model = model_loader.result('embedding_model')
+        self.embedding_model_path = str(model_path)
+        logger.info(f"   ✓ Geladen in {model_loader.load_times['embedding_model']:.2f}s")
+
+        self.embedding_cache = None
+        if embedding_cache_dir and EMBEDDING_CACHE_AVAILABLE:
+            # Pfad + Datei-Signatur: ein neues Model am selben Pfad liefert keine alten Vektoren
+            local_model = Path(model_path).exists()
+            embedding_model_id = make_key(
+                str(Path(model_path).resolve()) if local_model else self.embedding_model_path,
+                json.dumps(source_signature(model_path) if local_model else {}, sort_keys=True)
+            )
+            self.embedding_cache = EmbeddingCache(embedding_cache_dir, model_id=embedding_model_id)
+            logger.info(f"   💾 Embedding-Cache: {embedding_cache_dir} ({len(self.embedding_cache)} Einträge)")
 
         # Initialize BERTopic
         logger.info(f"\n[2/4] Initialisiere BERTopic Clustering Pipeline...")
         logger.info(f"   📦 Framework: BERTopic (HDBSCAN + UMAP)")
         logger.info(f"   🎯 Verwendung: Gruppiert Artikel in thematische Cluster")
-        logger.info(f"   ⚙️  Config: min_cluster_size=2, n_neighbors=3, n_components=5")
-
-        # Import HDBSCAN for custom parameters
-        from hdbscan import HDBSCAN
-        from umap import UMAP
-        from sklearn.feature_extraction.text import CountVectorizer
+        logger.info(f"   ⚙️  Config: Profil '{clustering_profile}' (UMAP/HDBSCAN werden beim Clustering an die Artikelanzahl angepasst)")
 
-        start_time = time.time()
+        self.clustering_profile = clustering_profile
+        self.cluster_config = None
+        self.ann_knn = ann_knn and ANN_AVAILABLE
+        self.ann_probe = ann_probe
+        self.generate_summaries = generate_summaries
+        self.sentence_store = None
+        self.ann_index = None
+        self.article_embeddings = None
+        if ann_knn and not ANN_AVAILABLE:
+            logger.warning("   ⚠️  ANN-Index nicht verfügbar - UMAP verwendet die eigene kNN-Suche")
 
-        # Custom HDBSCAN for small datasets (< 50 documents)
-        hdbscan_model = HDBSCAN(
-            min_cluster_size=2,      # Minimum 2 documents per cluster (default: 10)
-            min_samples=1,            # Minimum samples in neighborhood (default: 5)
-            metric='euclidean',
-            cluster_selection_method='eom',
-            prediction_data=True
-        )
+        CountVectorizer = _timed_import('sklearn.feature_extraction.text').CountVectorizer
 
-        # Custom UMAP for small datasets
-        umap_model = UMAP(
-            n_neighbors=3,            # Reduced from default 15 for small datasets
-            n_components=5,           # Dimensionality
-            min_dist=0.0,
-            metric='cosine'
-        )
+        start_time = time.time()
 
         # Stopword filtering - wichtig für bessere Topic-Labels!
         # Englische + Deutsche Stoppwörter filtern
@@ -231,40 +562,55 @@ class BERTopicSentimentAnalyzer:
             'wird', 'sind', 'war', 'hat', 'haben', 'oder', 'nicht', 'im', 'am', 'zum'
         ]
 
-        vectorizer_model = CountVectorizer(
+        self.vectorizer_model = CountVectorizer(
             stop_words=stop_words,
             ngram_range=(1, 2),  # Unigrams und Bigrams
             min_df=1
         )
 
-        self.topic_model = BERTopic(
-            embedding_model=self.embedding_model,
-            hdbscan_model=hdbscan_model,
-            umap_model=umap_model,
-            vectorizer_model=vectorizer_model,  # Mit Stoppwort-Filterung!
-            language='multilingual',
-            calculate_probabilities=True,
-            verbose=True,
-            min_topic_size=2          # Minimum documents per topic (default: 10)
-        )
+        # Topic-Model wird in analyze() gebaut, sobald die Artikelanzahl bekannt ist
+        self.topic_model = None
 
         load_time = time.time() - start_time
         logger.info(f"   ✓ Initialisiert in {load_time:.2f}s")
 
+        # Gespeichertes Topic-Model laden → nur transform(), stabile Topic-IDs zwischen Läufen
+        self.topic_model_path = Path(topic_model_path) if topic_model_path else None
+        self.topic_model_fitted = False
+        if self.topic_model_path and not refit_topic_model and (self.topic_model_path / "config.json").exists():
+            model_loader.run('topic_model', self._load_topic_model)
+            if self.topic_model_fitted:
+                logger.info(f"   ♻️  Gespeichertes Topic-Model geladen in {model_loader.load_times['topic_model']:.2f}s: {self.topic_model_path}")
+
         # Load sentiment analyzer for comments
         logger.info(f"\n[3/4] Lade Sentiment Analyzer für Kommentare...")
-        if SENTIMENT_AVAILABLE:
-            start_time = time.time()
-            self.sentiment_analyzer = OfflineSentimentAnalyzer()
-            load_time = time.time() - start_time
+        self.sentiment_batch_size = sentiment_batch_size
+        self.comment_deduplicator = None
+        if DEDUP_AVAILABLE:
+            self.comment_deduplicator = CommentDeduplicator(
+                near_duplicates=near_dedup,
+                similarity_threshold=near_dedup_threshold
+            )
+        if 'sentiment' in loaders:
+            self.sentiment_analyzer = model_loader.result('sentiment')
+            load_time = model_loader.load_times['sentiment']
 
             # Get detailed model info
-            if hasattr(self.sentiment_analyzer, 'model') and self.sentiment_analyzer.model:
+            if self.sentiment_analyzer.mode == 'bert':
                 model_name = "nlptown/bert-base-multilingual-uncased-sentiment"
                 logger.info(f"   📦 Model: {model_name}")
                 logger.info(f"   🎯 Verwendung: Sentiment-Analyse von Kommentaren (Positiv/Neutral/Negativ)")
                 logger.info(f"   🌍 Sprachen: en, de, fr, it, es, nl")
                 logger.info(f"   ⚙️  Output: 5-star rating → 3 Kategorien")
+                logger.info(f"   🚀 Backend: {self.sentiment_analyzer.backend}")
+                quant_info = self.sentiment_analyzer.quantization_info
+                if quant_info:
+                    logger.info(f"   🔢 Präzision: {self.sentiment_analyzer.precision} (int8 Agreement {quant_info['agreement']:.1%} auf {quant_info['eval_samples']} Kommentaren)")
+                if self.sentiment_analyzer.num_workers > 1:
+                    logger.info(f"   🧵 Worker: {self.sentiment_analyzer.num_workers} Prozesse × {self.sentiment_analyzer.threads_per_worker} Threads")
+                cache_stats = self.sentiment_analyzer.get_cache_stats()
+                if cache_stats:
+                    logger.info(f"   💾 Cache: {cache_stats['path']} ({cache_stats['entries']} Einträge)")
             else:
                 logger.info(f"   📦 Mode: Lexikon-basiert (Fallback)")
 
@@ -279,15 +625,14 @@ class BERTopicSentimentAnalyzer:
         self.abstractive_summarizer = None
 
         if use_abstractive:
-            if ABSTRACTIVE_AVAILABLE:
+            if 'abstractive' in loaders:
                 try:
-                    start_time = time.time()
-                    self.abstractive_summarizer = AbstractiveSummarizer()
-                    load_time = time.time() - start_time
+                    self.abstractive_summarizer = model_loader.result('abstractive')
+                    load_time = model_loader.load_times['abstractive']
                     logger.info(f"   📦 Model: facebook/mBART-large-50-many-to-many-mmt")
                     logger.info(f"   🎯 Verwendung: Generiert Article Summaries + Topic Labels")
                     logger.info(f"   🌍 Sprachen: 50+ (inkl. de_DE, en_XX)")
-                    logger.info(f"   ⚙️  Params: ~611M, Beam Search (num_beams=4)")
+                    logger.info(f"   ⚙️  Params: ~611M, Label-Decoding: {label_decoding}, Precision: {self.abstractive_summarizer.precision}")
                     logger.info(f"   ✓ Geladen in {load_time:.2f}s")
                 except Exception as e:
                     logger.warning(f"   ⚠️  Konnte nicht geladen werden: {e}")
@@ -331,10 +676,291 @@ class BERTopicSentimentAnalyzer:
             print(line)
             logger.info(line)
 
+        self.model_load_summary = model_loader.summary(chains=[['embedding_model', 'topic_model']])
+        load_summary = self.model_load_summary
+        logger.info(
+            f"⏱️  Model-Laden: {load_summary['wall']:.2f}s Wall, {load_summary['total']:.2f}s Summe "
+            f"({', '.join(f'{name} {seconds:.2f}s' for name, seconds in load_summary['load_times'].items())})"
+        )
+        logger.info(
+            f"   Kritischer Pfad: {' → '.join(load_summary['critical_path'])} ({load_summary['critical_seconds']:.2f}s)"
+            + (" - parallel geladen" if model_loader.concurrent else "")
+        )
+
         logger.info("\n" + "=" * 70)
         logger.info("Initialisierung abgeschlossen!")
         logger.info("=" * 70 + "\n")
 
+    def _build_topic_model(self, n_docs: int):
+        """
+        Build the BERTopic pipeline with UMAP/HDBSCAN sized for n_docs articles
+
+        Args:
+            n_docs: Number of articles that will be clustered
+        """
+        BERTopic = _timed_import('bertopic').BERTopic
+        HDBSCAN = _timed_import('hdbscan').HDBSCAN
+        UMAP = _timed_import('umap').UMAP
+
+        config = clustering_config(n_docs, self.clustering_profile)
+        self.cluster_config = config
+
+        hdbscan_model = HDBSCAN(
+            min_cluster_size=config['min_cluster_size'],
+            min_samples=config['min_samples'],
+            metric='euclidean',
+            cluster_selection_method='eom',
+            core_dist_n_jobs=config['core_dist_n_jobs'],
+            prediction_data=True
+        )
+
+        # kNN-Graph aus dem IVF-Index statt UMAP-interner Suche; der Index bleibt
+        # als Suchindex im UMAP-Model, damit transform() (gespeicherte Topic-Models) funktioniert
+        # UMAP ignoriert einen kNN-Graph mit weniger Nachbarn als n_neighbors → gleiches k für beide
+        n_neighbors = min(config['n_neighbors'], n_docs)
+        precomputed_knn = (None, None, None)
+        if self.ann_index is not None:
+            knn_start = time.time()
+            knn_indices, knn_dists = self.ann_index.knn_graph(n_neighbors)
+            precomputed_knn = (knn_indices, knn_dists, self.ann_index)
+            logger.info(f"   🔎 kNN-Graph (IVF, k={n_neighbors}) in {time.time() - knn_start:.2f}s")
+
+        umap_model = UMAP(
+            n_neighbors=n_neighbors,
+            n_components=config['n_components'],
+            min_dist=0.0,
+            metric='cosine',
+            low_memory=config['low_memory'],
+            precomputed_knn=precomputed_knn
+        )
+
+        self.topic_model = BERTopic(
+            embedding_model=self.embedding_model,
+            hdbscan_model=hdbscan_model,
+            umap_model=umap_model,
+            vectorizer_model=self.vectorizer_model,  # Mit Stoppwort-Filterung!
+            language='multilingual',
+            calculate_probabilities=config['calculate_probabilities'],
+            verbose=True,
+            min_topic_size=config['min_cluster_size']
+        )
+
+        logger.info(
+            f"   ⚙️  Clustering-Profil '{config['profile']}' für {n_docs} Artikel: "
+            f"n_neighbors={config['n_neighbors']}, n_components={config['n_components']}, "
+            f"min_cluster_size={config['min_cluster_size']}, min_samples={config['min_samples']}, "
+            f"low_memory={config['low_memory']}, probabilities={config['calculate_probabilities']}"
+        )
+
+    def _article_embeddings(self, article_texts: List[str]):
+        """
+        Article embeddings for this run, computed once
+
+        Served from the embedding cache when enabled (only new or changed
+        articles are encoded), otherwise encoded in one pass. The result is
+        kept in self.article_embeddings and passed to BERTopic, the IVF index,
+        the representative document selection and the label prompts, so no
+        stage encodes the articles again.
+
+        Args:
+            article_texts: Article texts (title + content)
+
+        Returns:
+            Tuple of (embeddings [n, dim], seconds spent)
+        """
+        embedding_start = time.time()
+        if self.embedding_cache is not None:
+            embeddings = self.embedding_cache.get_or_encode(
+                article_texts,
+                lambda docs: self.embedding_model.encode(docs, show_progress_bar=False)
+            )
+            embedding_time = time.time() - embedding_start
+            embedding_stats = self.embedding_cache.get_stats()
+            logger.info(f"   💾 Embeddings: {embedding_stats['hits']} aus Cache, {embedding_stats['misses']} neu encodiert in {embedding_time:.2f}s")
+        else:
+            embeddings = np.asarray(self.embedding_model.encode(article_texts, show_progress_bar=False))
+            embedding_time = time.time() - embedding_start
+            logger.info(f"   🧮 Embeddings: {len(article_texts)} Artikel encodiert in {embedding_time:.2f}s")
+
+        self.article_embeddings = embeddings
+        return embeddings, embedding_time
+
+    @staticmethod
+    def _representative_doc_ids(topics: List[int], embeddings: np.ndarray, n_docs: int = 3) -> Dict[int, List[int]]:
+        """
+        Articles closest to their topic centroid, for all topics at once
+
+        Centroids are the mean normalized article embedding per topic; every
+        article is compared with the centroid of its own topic (cosine) and
+        the top n_docs per topic are picked with one sort.
+
+        Args:
+            topics: Topic assignment per article
+            embeddings: Article embeddings (same order as topics)
+            n_docs: Number of representative articles per topic
+
+        Returns:
+            Dictionary topic_id → up to n_docs article indices, most central first
+            (outlier topic -1 excluded)
+        """
+        topic_array = np.asarray(topics)
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+        topic_ids, labels = np.unique(topic_array, return_inverse=True)
+        centroids = np.zeros((len(topic_ids), vectors.shape[1]), dtype=np.float32)
+        np.add.at(centroids, labels, vectors)
+        centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+
+        similarities = np.einsum('ij,ij->i', vectors, centroids[labels])
+
+        # Nach Topic gruppieren, innerhalb des Topics absteigend nach Ähnlichkeit
+        order = np.lexsort((-similarities, labels))
+        starts = np.searchsorted(labels[order], np.arange(len(topic_ids)))
+        return {
+            int(topic_id): order[start:start + n_docs].tolist()
+            for topic_id, start in zip(topic_ids, starts)
+            if topic_id != -1
+        }
+
+    def _central_sentences(self, topic_ids: List[int], representative_ids: List[List[int]],
+                           article_texts: List[str], topics: List[int], embeddings) -> List[List[str]]:
+        """
+        Sentences of the representative articles per topic, most central first
+
+        Uses the sentence embeddings from the summary step (--summaries) when
+        available; otherwise the sentences of all representative articles are
+        encoded in one call. Centrality is the cosine similarity to the topic
+        centroid of the article embeddings (or to the mean sentence embedding
+        if no article embeddings were computed).
+
+        Args:
+            topic_ids: Topic per entry of representative_ids
+            representative_ids: Representative article indices per topic
+            article_texts: Article texts (same order as topics)
+            topics: Topic assignment per article
+            embeddings: Article embeddings (same order as topics) or None
+
+        Returns:
+            Ranked sentences per topic (same order as topic_ids)
+        """
+        if self.sentence_store is not None:
+            store = self.sentence_store
+            position = None
+        else:
+            articles = sorted({i for ids in representative_ids for i in ids})
+            store = encode_sentences([article_texts[i] for i in articles], self.embedding_model)
+            position = {article: row for row, article in enumerate(articles)}
+
+        offsets = store['offsets']
+        topic_array = np.asarray(topics)
+
+        ranked = []
+        for topic_id, ids in zip(topic_ids, representative_ids):
+            rows = np.concatenate([
+                np.arange(offsets[row], offsets[row + 1])
+                for row in (ids if position is None else [position[i] for i in ids])
+            ] + [np.zeros(0, dtype=np.int64)])
+            if len(rows) == 0:
+                ranked.append([])
+                continue
+
+            segment = store['embeddings'][rows]
+            segment = segment / np.maximum(np.linalg.norm(segment, axis=1, keepdims=True), 1e-12)
+            if embeddings is not None:
+                centroid = np.asarray(embeddings)[topic_array == topic_id].mean(axis=0)
+            else:
+                centroid = segment.mean(axis=0)
+            similarities = segment @ (centroid / max(np.linalg.norm(centroid), 1e-12))
+            order = np.argsort(-similarities, kind='stable')
+            ranked.append([store['sentences'][rows[i]] for i in order])
+
+        return ranked
+
+    def _save_topic_model(self):
+        """
+        Save the fitted topic model for transform-only runs
+
+        BERTopic itself is stored pickle-free (safetensors: topic embeddings,
+        c-TF-IDF, topic mapping). UMAP and HDBSCAN have no such format and are
+        stored with joblib so transform() can use HDBSCAN's prediction data.
+        A format marker records the layout version (and the IVF index version
+        when the pickled UMAP carries an IVFIndex) so _load_topic_model can
+        refuse incompatible models instead of failing inside unpickling.
+        """
+        import joblib
+
+        self.topic_model_path.mkdir(parents=True, exist_ok=True)
+        self.topic_model.save(
+            str(self.topic_model_path),
+            serialization="safetensors",
+            save_ctfidf=True,
+            save_embedding_model=False  # Wird beim Laden übergeben (sonst lädt BERTopic es ein zweites Mal)
+        )
+        joblib.dump(
+            {'umap_model': self.topic_model.umap_model, 'hdbscan_model': self.topic_model.hdbscan_model},
+            self.topic_model_path / TOPIC_CLUSTER_MODELS_FILE
+        )
+        with open(self.topic_model_path / TOPIC_MODEL_FORMAT_FILE, 'w', encoding='utf-8') as f:
+            json.dump({
+                'format_version': TOPIC_MODEL_FORMAT_VERSION,
+                'cluster_models': TOPIC_CLUSTER_MODELS_FILE,
+                'ivf_index_version': IVF_INDEX_VERSION if self.ann_index is not None else None
+            }, f, indent=2)
+        logger.info(f"   💾 Topic-Model gespeichert: {self.topic_model_path}")
+
+    def _load_topic_model(self):
+        """
+        Load a saved topic model (see _save_topic_model) and attach UMAP/HDBSCAN
+
+        Models without a matching format marker, or that fail to load, are
+        skipped: topic_model_fitted stays False and analyze() fits a new model
+        (and saves it over the old one).
+        """
+        format_file = self.topic_model_path / TOPIC_MODEL_FORMAT_FILE
+        try:
+            with open(format_file, 'r', encoding='utf-8') as f:
+                model_format = json.load(f)
+        except (OSError, ValueError):
+            model_format = {}
+        expected_ivf = IVF_INDEX_VERSION if ANN_AVAILABLE else None
+        if model_format.get('format_version') != TOPIC_MODEL_FORMAT_VERSION:
+            logger.warning(
+                f"   ⚠️  Topic-Model in {self.topic_model_path} hat kein passendes Format "
+                f"({TOPIC_MODEL_FORMAT_FILE}: {model_format.get('format_version')} statt {TOPIC_MODEL_FORMAT_VERSION}) → neuer Fit"
+            )
+            return
+        if model_format.get('ivf_index_version') not in (None, expected_ivf):
+            logger.warning(
+                f"   ⚠️  Topic-Model enthält einen IVF-Index in Version {model_format['ivf_index_version']} "
+                f"(aktuell: {expected_ivf}) → neuer Fit"
+            )
+            return
+
+        BERTopic = _timed_import('bertopic').BERTopic
+        cluster_file = self.topic_model_path / TOPIC_CLUSTER_MODELS_FILE
+        try:
+            topic_model = BERTopic.load(str(self.topic_model_path), embedding_model=self.embedding_model)
+            cluster_models = None
+            if cluster_file.exists():
+                import joblib
+
+                # joblib = pickle: führt beim Laden Code aus, nur selbst erstellte Topic-Models laden
+                logger.warning(f"   🔒 {cluster_file.name} wird per Pickle geladen - nur vertrauenswürdige --topic-model Verzeichnisse verwenden")
+                cluster_models = joblib.load(cluster_file)
+        except Exception as e:
+            logger.warning(f"   ⚠️  Topic-Model konnte nicht geladen werden ({type(e).__name__}: {e}) → neuer Fit")
+            return
+
+        if cluster_models is not None:
+            topic_model.umap_model = cluster_models['umap_model']
+            topic_model.hdbscan_model = cluster_models['hdbscan_model']
+        else:
+            logger.warning(f"   ⚠️  {TOPIC_CLUSTER_MODELS_FILE} fehlt - Zuordnung nur über Topic-Embeddings (Cosine)")
+
+        self.topic_model = topic_model
+        self.topic_model_fitted = True
+
     def analyze(self, json_file: str, output_file: str = None):
         """
         Complete analysis pipeline
@@ -349,6 +975,7 @@ class BERTopicSentimentAnalyzer:
 
         # Track overall time
         analysis_start_time = time.time()
+        pd = _timed_import('pandas')
 
         # Step 1: Load data
         logger.info(f"\n[STEP 1/5] Lade Daten aus {json_file}...")
@@ -394,16 +1021,50 @@ class BERTopicSentimentAnalyzer:
             print(line)
             logger.info(line)
 
-        # SKIP SUMMARY GENERATION completely - not needed
-        logger.info(f"\n   ⚡ SKIP: Summary-Spalte komplett entfernt (nicht benötigt)")
-        logger.info(f"   → Excel enthält: Title, URL, Topic, Comments")
+        if self.generate_summaries:
+            # Alle Sätze aller Artikel in einem Durchlauf encodieren (wird für Topic-Labels wiederverwendet)
+            summary_start = time.time()
+            self.sentence_store = encode_sentences(
+                [article.get('content', '') for article in articles_data], self.embedding_model
+            )
+            articles_df['summary'] = extractive_summarize_corpus(self.sentence_store)
+            summary_time = time.time() - summary_start
+            logger.info(
+                f"   📝 Extractive Summaries: {len(self.sentence_store['sentences'])} Sätze aus "
+                f"{len(articles_data)} Artikeln encodiert in {summary_time:.2f}s"
+            )
+        else:
+            # SKIP SUMMARY GENERATION completely - not needed
+            logger.info(f"\n   ⚡ SKIP: Summary-Spalte komplett entfernt (nicht benötigt, aktivieren mit --summaries)")
+            logger.info(f"   → Excel enthält: Title, URL, Topic, Comments")
 
         # Step 3: Cluster articles with BERTopic
         logger.info(f"\n[STEP 3/5] Clustere Artikel mit BERTopic...")
         logger.info(f"   🔄 Embedding → UMAP → HDBSCAN Clustering...")
         step_start = time.time()
 
-        topics, probabilities = self.topic_model.fit_transform(article_texts)
+        # Artikel-Embeddings einmal berechnen (bzw. aus dem Cache) und überall wiederverwenden:
+        # BERTopic (fit_transform/transform), IVF-Index, repräsentative Dokumente, Label-Prompts
+        embeddings, embedding_time = self._article_embeddings(article_texts)
+
+        if self.topic_model_fitted:
+            # Transform-only: UMAP.transform + HDBSCAN approximate_predict, kein Fit
+            logger.info(f"   ♻️  Transform-only mit gespeichertem Topic-Model (Topic-Größen stammen aus dem Referenz-Fit)")
+            topics, probabilities = self.topic_model.transform(article_texts, embeddings=embeddings)
+            probabilities = np.asarray(probabilities)
+        else:
+            # transform() nutzt den im gespeicherten UMAP enthaltenen Index → nur beim Fit bauen
+            if self.ann_knn:
+                ann_start = time.time()
+                self.ann_index = IVFIndex(n_probe=self.ann_probe).fit(embeddings)
+                logger.info(f"   🔎 IVF-Index über {len(article_texts)} Artikel in {time.time() - ann_start:.2f}s")
+            self._build_topic_model(len(article_texts))
+            with warnings.catch_warnings():
+                # IVF-Index statt NNDescent als Suchindex: UMAP warnt beim Fit, transform() nutzt query() trotzdem
+                warnings.filterwarnings('ignore', message=r'precomputed_knn\[2\]')
+                topics, probabilities = self.topic_model.fit_transform(article_texts, embeddings=embeddings)
+            if self.topic_model_path:
+                self._save_topic_model()
 
         step_time = time.time() - step_start
         # Get topic info
@@ -438,55 +1099,59 @@ class BERTopicSentimentAnalyzer:
             step_start = time.time()
             topic_ids = [tid for tid in set(topics) if tid != -1]
 
-            # Track timing for each topic
-            topic_times = []
-            for topic_id in tqdm(topic_ids, desc="      Topic Labels", disable=not TQDM_AVAILABLE):
-                # Get topic keywords and representative documents
+            # Keywords und repräsentative Dokumente für alle Topics sammeln
+            label_topic_ids = []
+            label_inputs = []
+            label_doc_ids = []
+            representative = self._representative_doc_ids(topics, embeddings)
+            for topic_id in topic_ids:
                 topic_words = self.topic_model.get_topic(topic_id)
-                representative_docs = [article_texts[i] for i, t in enumerate(topics) if t == topic_id][:3]
-
-                if topic_words:
-                    try:
-                        # Generate concise label with mBART
-                        topic_start = time.time()
-
-                        # Log debug info
-                        debug_lines = [
-                            f"\n🔍 Calling mBART for topic {topic_id}...",
-                            f"   Keywords: {topic_words[:3]}",
-                            f"   Docs: {len(representative_docs)}"
-                        ]
-                        for line in debug_lines:
-                            print(line)
-                            logger.info(line)
-
-                        label = self.abstractive_summarizer.generate_topic_label(
-                            keywords=topic_words,
-                            representative_docs=representative_docs,
-                            source_lang="de_DE",
-                            max_keywords=3
-                        )
-
-                        topic_time = time.time() - topic_start
-                        topic_times.append(topic_time)
-
-                        result_msg = f"   Generated label: '{label}' (took {topic_time:.2f}s)"
-                        print(result_msg)
-                        logger.info(result_msg)
-
-                        topic_labels[topic_id] = label
-                    except Exception as e:
-                        error_msg = f"   ❌ ERROR in generate_topic_label: {e}"
-                        print(error_msg)
-                        logger.error(error_msg)
-                        import traceback
-                        traceback.print_exc()
-                        logger.error(traceback.format_exc())
-                        # Fallback to keywords
-                        top_words = [word for word, _ in topic_words[:3]]
-                        topic_labels[topic_id] = " & ".join(top_words).capitalize()
-                else:
+                if not topic_words:
                     topic_labels[topic_id] = f"Topic {topic_id}"
+                    continue
+
+                representative_ids = representative.get(topic_id, [])
+
+                label_topic_ids.append(topic_id)
+                label_inputs.append((topic_words, [article_texts[i] for i in representative_ids]))
+                label_doc_ids.append(representative_ids)
+
+            # Alle Labels in wenigen gebatchten mBART-Aufrufen generieren
+            topic_times = []
+            if label_inputs:
+                labels_start = time.time()
+                try:
+                    central_sentences = None
+                    if self.abstractive_summarizer.prompt_token_budget:
+                        central_sentences = self._central_sentences(
+                            label_topic_ids, label_doc_ids, article_texts, topics, embeddings
+                        )
+                    labels = self.abstractive_summarizer.generate_topic_labels_batch(
+                        label_inputs,
+                        source_lang="de_DE",
+                        max_keywords=3,
+                        central_sentences=central_sentences
+                    )
+                except Exception as e:
+                    error_msg = f"   ❌ ERROR in generate_topic_labels_batch: {e}"
+                    print(error_msg)
+                    logger.error(error_msg)
+                    import traceback
+                    traceback.print_exc()
+                    logger.error(traceback.format_exc())
+                    # Fallback to keywords
+                    labels = [
+                        " & ".join(word for word, _ in topic_words[:3]).capitalize()
+                        for topic_words, _ in label_inputs
+                    ]
+
+                # Zeit gleichmäßig auf die Topics verteilen (für PERFORMANCE BREAKDOWN)
+                labels_time = time.time() - labels_start
+                topic_times = [labels_time / len(label_inputs)] * len(label_inputs)
+
+                for topic_id, label in zip(label_topic_ids, labels):
+                    topic_labels[topic_id] = label
+                    logger.info(f"   Topic {topic_id}: '{label}'")
 
             topic_labels[-1] = "Uncategorized"  # Handle outliers
             step_time = time.time() - step_start
@@ -532,11 +1197,57 @@ class BERTopicSentimentAnalyzer:
         step_start = time.time()
 
         # Track comment processing timing
-        comment_times = []
+        comment_sentiment_time = 0.0
         processed_comments = 0
+        dedup = None
 
         if self.sentiment_analyzer:
-            for idx, article in tqdm(enumerate(articles_data), total=len(articles_data), desc="      Comments", disable=not TQDM_AVAILABLE):
+            # Sammle alle Kommentar-Texte vorab → ein Batch-Lauf statt ein Pipeline-Call pro Kommentar
+            comment_texts = [
+                comment_obj.get('text', '')
+                for article in articles_data
+                for comment_obj in article.get('comments', [])
+                if comment_obj.get('text', '')
+            ]
+
+            # Duplikate zusammenfassen → nur Repräsentanten werden bewertet
+            if self.comment_deduplicator:
+                dedup = self.comment_deduplicator.deduplicate(comment_texts)
+                model_texts = dedup['representatives']
+                dedup_msg = (f"   🧹 Dedup: {len(comment_texts)} Kommentare → {len(model_texts)} Model-Inputs "
+                             f"({dedup['exact_duplicates']} exakt, {dedup['near_duplicates']} ähnlich, "
+                             f"Ratio {dedup['dedup_ratio']:.1%})")
+                logger.info(dedup_msg)
+            else:
+                model_texts = comment_texts
+
+            logger.info(f"   📦 Batch-Inferenz: {len(model_texts)} Kommentare (batch_size={self.sentiment_batch_size})")
+
+            def log_progress(done: int, total: int):
+                elapsed = time.time() - inference_start
+                avg_time = elapsed / done if done else 0.0
+                est_remaining = avg_time * (total - done)
+                progress_msg = f"      Progress: {done}/{total} Kommentare | Avg: {avg_time*1000:.1f}ms/Kommentar | ETA: {est_remaining:.1f}s"
+                print(progress_msg)
+                logger.info(progress_msg)
+
+            inference_start = time.time()
+            sentiment_results = self.sentiment_analyzer.analyze_batch(
+                model_texts,
+                batch_size=self.sentiment_batch_size,
+                progress_callback=log_progress
+            )
+            comment_sentiment_time = time.time() - inference_start
+
+            # Ergebnisse der Repräsentanten auf alle Kommentare auffächern
+            if dedup:
+                sentiment_results = [dict(sentiment_results[rep]) for rep in dedup['assignments']]
+            processed_comments = len(sentiment_results)
+
+            # Verteile Ergebnisse zurück auf Artikel (gleiche Reihenfolge wie comment_texts)
+            results_iter = iter(sentiment_results)
+
+            for idx, article in enumerate(articles_data):
                 url = article.get('url', '')
                 title = article.get('title', '')
                 comments = article.get('comments', [])
@@ -552,32 +1263,17 @@ class BERTopicSentimentAnalyzer:
                     'sentiment_scores': []
                 }
 
-                # Analyze sentiment for each comment
                 for comment_obj in comments:
                     comment_text = comment_obj.get('text', '')
                     author = comment_obj.get('author', 'Unknown')
                     date = comment_obj.get('date', '')
 
                     if comment_text:
-                        # Analyze sentiment with timing
-                        comment_start = time.time()
-                        sentiment_result = self.sentiment_analyzer.analyze(comment_text)
-                        comment_time = time.time() - comment_start
-                        comment_times.append(comment_time)
-                        processed_comments += 1
+                        sentiment_result = next(results_iter)
 
                         sentiment_category = sentiment_result.get('category', 'unknown')
                         sentiment_score = sentiment_result.get('score', 0.0)
 
-                        # Log progress every 50 comments
-                        if processed_comments % 50 == 0:
-                            avg_time = sum(comment_times) / len(comment_times)
-                            remaining = total_comments - processed_comments
-                            est_remaining = avg_time * remaining
-                            progress_msg = f"      Progress: {processed_comments}/{total_comments} Kommentare | Avg: {avg_time*1000:.1f}ms/Kommentar | ETA: {est_remaining:.1f}s"
-                            print(progress_msg)
-                            logger.info(progress_msg)
-
                         # Aggregate sentiment counts per article
                         if sentiment_category == 'positive':
                             article_sentiments[url]['positive_count'] += 1
@@ -608,7 +1304,7 @@ class BERTopicSentimentAnalyzer:
                         })
 
             step_time = time.time() - step_start
-            logger.info(f"   ✓ Sentiment-Analyse abgeschlossen in {step_time:.2f}s ({step_time/total_comments:.3f}s pro Kommentar)")
+            logger.info(f"   ✓ Sentiment-Analyse abgeschlossen in {step_time:.2f}s ({step_time/max(total_comments, 1):.3f}s pro Kommentar)")
         else:
             logger.warning("   ⚠️  Sentiment-Analyse übersprungen (Analyzer nicht verfügbar)")
             # Create details without sentiment
@@ -651,9 +1347,13 @@ class BERTopicSentimentAnalyzer:
             output_file = Path(output_file)
 
         with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            # Sheet 1: Article Overview with Sentiment Aggregation (WITHOUT Summary)
+            # Sheet 1: Article Overview with Sentiment Aggregation (Summary only with --summaries)
             overview_df = articles_df[['url', 'title', 'topic_label', 'topic']].copy()
             overview_df.columns = ['URL', 'Title', 'Topic', 'Topic_ID']
+            summary_columns = []
+            if 'summary' in articles_df.columns:
+                overview_df.insert(2, 'Summary', articles_df['summary'])
+                summary_columns = ['Summary']
 
             # Add sentiment aggregation columns
             if self.sentiment_analyzer and article_sentiments:
@@ -678,8 +1378,8 @@ class BERTopicSentimentAnalyzer:
                     lambda url: article_sentiments.get(url, {}).get('neutral_count', 0)
                 )
 
-                # Reorder columns (WITHOUT Summary)
-                overview_df = overview_df[['URL', 'Title', 'Topic', 'Topic_ID', 'Avg_Sentiment', 'Rating',
+                # Reorder columns (Summary only with --summaries)
+                overview_df = overview_df[['URL', 'Title'] + summary_columns + ['Topic', 'Topic_ID', 'Avg_Sentiment', 'Rating',
                                           'Total_Comments', 'Positive_Count', 'Negative_Count', 'Neutral_Count']]
 
                 # Sort by sentiment score (highest first)
@@ -732,12 +1432,35 @@ class BERTopicSentimentAnalyzer:
             total_topics_time = sum(topic_times)
             logger.info(f"   └─ Topic Labels (mBART): {total_topics_time:.1f}s ({avg_topic:.1f}s/Topic, {len(topic_times)} Topics)")
 
-        if 'comment_times' in locals() and comment_times:
-            avg_comment = sum(comment_times) / len(comment_times)
-            total_comments_time = sum(comment_times)
-            logger.info(f"   └─ Comment Sentiment: {total_comments_time:.1f}s ({avg_comment*1000:.1f}ms/Kommentar, {len(comment_times)} Kommentare)")
+        label_cache_stats = self.abstractive_summarizer.get_label_cache_stats() if self.abstractive_summarizer else None
+        if label_cache_stats:
+            logger.info(f"   └─ Label Cache: {label_cache_stats['hits']} Hits / {label_cache_stats['misses']} Misses (Hit-Rate {label_cache_stats['hit_rate']:.1%}, {label_cache_stats['entries']} Einträge)")
 
-        logger.info(f"\n   💡 Hinweis: Summary-Spalte entfernt (nicht benötigt)")
+        if self.embedding_cache is None:
+            logger.info(f"   └─ Article Embeddings: {embedding_time:.1f}s (einmal berechnet, ohne Cache)")
+        else:
+            embedding_stats = self.embedding_cache.get_stats()
+            logger.info(f"   └─ Article Embeddings: {embedding_time:.1f}s ({embedding_stats['hits']} Hits / {embedding_stats['misses']} Misses, Hit-Rate {embedding_stats['hit_rate']:.1%}, {embedding_stats['entries']} Einträge)")
+
+        if processed_comments:
+            avg_comment = comment_sentiment_time / processed_comments
+            logger.info(f"   └─ Comment Sentiment: {comment_sentiment_time:.1f}s ({avg_comment*1000:.1f}ms/Kommentar, {processed_comments} Kommentare, batch_size={self.sentiment_batch_size})")
+
+        if dedup:
+            logger.info(f"   └─ Comment Dedup: {dedup['total']} → {len(dedup['representatives'])} Model-Inputs (Ratio {dedup['dedup_ratio']:.1%})")
+
+        cache_stats = self.sentiment_analyzer.get_cache_stats() if self.sentiment_analyzer else None
+        if cache_stats:
+            logger.info(f"   └─ Sentiment Cache: {cache_stats['hits']} Hits / {cache_stats['misses']} Misses (Hit-Rate {cache_stats['hit_rate']:.1%}, {cache_stats['entries']} Einträge, {cache_stats['evictions']} verdrängt)")
+
+        if IMPORT_TIMES:
+            import_summary = ", ".join(
+                f"{name} {seconds:.1f}s" for name, seconds in sorted(IMPORT_TIMES.items(), key=lambda item: -item[1])
+            )
+            logger.info(f"   └─ Imports (vor/während der Analyse): {sum(IMPORT_TIMES.values()):.1f}s ({import_summary})")
+
+        if not self.generate_summaries:
+            logger.info(f"\n   💡 Hinweis: Summary-Spalte entfernt (aktivieren mit --summaries)")
 
         logger.info("=" * 70 + "\n")
 
@@ -747,8 +1470,9 @@ class BERTopicSentimentAnalyzer:
         for handler in logging.getLogger().handlers:
             handler.flush()
 
-        logger.info(f"\n📝 Logfile gespeichert: {log_file}")
-        print(f"\n📝 Logfile gespeichert: {log_file}")
+        if log_file is not None:
+            logger.info(f"\n📝 Logfile gespeichert: {log_file}")
+            print(f"\n📝 Logfile gespeichert: {log_file}")
 
         return output_file
 
@@ -781,27 +1505,204 @@ def main():
         action='store_true',
         help='Use abstractive summarization (requires mBART model)'
     )
+    parser.add_argument(
+        '--abstractive-precision',
+        choices=['fp32', 'int8', 'bf16'],
+        default='fp32',
+        help='mBART precision with --abstractive: int8 quantizes Linear layers, bf16 needs native CPU support; converted weights are cached next to the model (default: fp32)'
+    )
+    parser.add_argument(
+        '--label-token-budget',
+        type=int,
+        default=256,
+        help='Tokens of representative-article sentences in each mBART label prompt, most central sentences first; 0 uses the first 1000 characters of 3 articles (default: 256)'
+    )
+    parser.add_argument(
+        '--label-decoding',
+        choices=['auto', 'greedy', 'beam2', 'beam4'],
+        default='auto',
+        help='mBART label decoding; auto decodes greedily and retries with 4 beams only when a label is empty or too long (default: auto)'
+    )
+    parser.add_argument(
+        '--summaries',
+        action='store_true',
+        help='Add an extractive Summary column (3 most central sentences per article, all sentences encoded in one pass)'
+    )
+    parser.add_argument(
+        '--sentiment-batch-size',
+        type=int,
+        default=32,
+        help='Number of comments per sentiment forward pass (default: 32)'
+    )
+    parser.add_argument(
+        '--sentiment-cache',
+        type=str,
+        default=str(Path(__file__).parent / "data" / "cache" / "sentiment_cache.sqlite"),
+        help='SQLite file for the persistent sentiment result cache'
+    )
+    parser.add_argument(
+        '--sentiment-cache-size',
+        type=int,
+        default=200000,
+        help='Maximum number of cached sentiment results, least recently used are evicted (default: 200000)'
+    )
+    parser.add_argument(
+        '--no-sentiment-cache',
+        action='store_true',
+        help='Disable the persistent sentiment result cache'
+    )
+    parser.add_argument(
+        '--sentiment-workers',
+        type=int,
+        default=1,
+        help='Number of worker processes for comment sentiment scoring, each loads the model once (default: 1)'
+    )
+    parser.add_argument(
+        '--sentiment-int8',
+        action='store_true',
+        help='Use the int8 dynamically quantized sentiment model (built once next to the original model)'
+    )
+    parser.add_argument(
+        '--sentiment-min-agreement',
+        type=float,
+        default=0.95,
+        help='Minimum int8 vs fp32 label agreement on test_realistic_articles.json comments (default: 0.95)'
+    )
+    parser.add_argument(
+        '--sentiment-backend',
+        choices=['torch', 'onnx'],
+        default='torch',
+        help='Inference backend for the sentiment model; onnx exports the model once and runs it with onnxruntime (default: torch)'
+    )
+    parser.add_argument(
+        '--sentiment-window-overlap',
+        type=int,
+        default=128,
+        help='Token overlap between windows when a comment is longer than 512 tokens (default: 128)'
+    )
+    parser.add_argument(
+        '--sentiment-window-aggregation',
+        choices=['mean', 'max'],
+        default='mean',
+        help='Combine window predictions of long comments by mean probability or most confident window (default: mean)'
+    )
+    parser.add_argument(
+        '--embedding-cache',
+        type=str,
+        default=str(Path(__file__).parent / "data" / "cache" / "embeddings"),
+        help='Directory for the persistent article embedding cache'
+    )
+    parser.add_argument(
+        '--no-embedding-cache',
+        action='store_true',
+        help='Disable the article embedding cache (re-encode every article)'
+    )
+    parser.add_argument(
+        '--topic-model',
+        type=str,
+        default=None,
+        help='Directory of a saved topic model: fitted and saved on the first run, later runs only transform new articles (stable topic IDs)'
+    )
+    parser.add_argument(
+        '--refit-topic-model',
+        action='store_true',
+        help='Fit a new topic model and overwrite the one saved under --topic-model'
+    )
+    parser.add_argument(
+        '--clustering-profile',
+        choices=list(CLUSTERING_PROFILES),
+        default='auto',
+        help=f"UMAP/HDBSCAN configuration: auto (scaled to corpus size, large from {LARGE_CORPUS_THRESHOLD} articles), small (< 50 articles) or large (default: auto)"
+    )
+    parser.add_argument(
+        '--ann-knn',
+        action='store_true',
+        help='Precompute the UMAP kNN graph with a NumPy IVF index over the article embeddings (faster for thousands of articles)'
+    )
+    parser.add_argument(
+        '--ann-probe',
+        type=int,
+        default=8,
+        help='IVF lists searched per query with --ann-knn; higher is more exact but slower (default: 8)'
+    )
+    parser.add_argument(
+        '--label-cache',
+        type=str,
+        default=str(Path(__file__).parent / "data" / "cache" / "label_cache.sqlite"),
+        help='SQLite file for the persistent mBART topic label cache (used with --abstractive)'
+    )
+    parser.add_argument(
+        '--no-label-cache',
+        action='store_true',
+        help='Disable the topic label cache (generate every label with mBART)'
+    )
+    parser.add_argument(
+        '--parallel-init',
+        action='store_true',
+        help='Load the embedding, sentiment and mBART models in parallel threads (load times and critical path are logged)'
+    )
+    parser.add_argument(
+        '--near-dedup',
+        action='store_true',
+        help='Also collapse near-duplicate comments (MinHash/LSH) before sentiment scoring'
+    )
+    parser.add_argument(
+        '--near-dedup-threshold',
+        type=float,
+        default=0.9,
+        help='Minimum character-shingle Jaccard similarity for near-duplicates (default: 0.9)'
+    )
 
     args = parser.parse_args()
 
-    # Check if BERTopic is available
+    # Eingaben prüfen, bevor Logfile und Models angelegt bzw. importiert werden
+    if not Path(args.input).exists():
+        sys.exit(f"❌ Input file nicht gefunden: {args.input}")
+
     if not BERTOPIC_AVAILABLE:
-        logger.error("❌ BERTopic ist nicht installiert!")
-        logger.error("   Bitte installiere mit:")
-        logger.error("   pip install bertopic sentence-transformers umap-learn hdbscan")
-        sys.exit(1)
+        sys.exit(
+            "❌ BERTopic ist nicht installiert!\n"
+            "   Bitte installiere mit:\n"
+            "   pip install bertopic sentence-transformers umap-learn hdbscan"
+        )
 
-    # Check if input file exists
-    if not Path(args.input).exists():
-        logger.error(f"❌ Input file nicht gefunden: {args.input}")
-        sys.exit(1)
+    setup_logging()
 
     # Run analysis
     analyzer = BERTopicSentimentAnalyzer(
         model_path=args.model_path,
-        use_abstractive=args.abstractive
+        use_abstractive=args.abstractive,
+        sentiment_batch_size=args.sentiment_batch_size,
+        sentiment_cache_path=None if args.no_sentiment_cache else args.sentiment_cache,
+        sentiment_cache_size=args.sentiment_cache_size,
+        near_dedup=args.near_dedup,
+        near_dedup_threshold=args.near_dedup_threshold,
+        sentiment_workers=args.sentiment_workers,
+        sentiment_int8=args.sentiment_int8,
+        sentiment_min_agreement=args.sentiment_min_agreement,
+        sentiment_backend=args.sentiment_backend,
+        sentiment_window_overlap=args.sentiment_window_overlap,
+        sentiment_window_aggregation=args.sentiment_window_aggregation,
+        embedding_cache_dir=None if args.no_embedding_cache else args.embedding_cache,
+        topic_model_path=args.topic_model,
+        refit_topic_model=args.refit_topic_model,
+        clustering_profile=args.clustering_profile,
+        ann_knn=args.ann_knn,
+        ann_probe=args.ann_probe,
+        label_cache_path=None if args.no_label_cache else args.label_cache,
+        abstractive_precision=args.abstractive_precision,
+        label_token_budget=args.label_token_budget,
+        label_decoding=args.label_decoding,
+        generate_summaries=args.summaries,
+        concurrent_init=args.parallel_init
     )
-    analyzer.analyze(args.input, args.output)
+    try:
+        analyzer.analyze(args.input, args.output)
+    finally:
+        if analyzer.sentiment_analyzer:
+            analyzer.sentiment_analyzer.close()
+        if analyzer.abstractive_summarizer:
+            analyzer.abstractive_summarizer.close()
 
 
 if __name__ == "__main__":
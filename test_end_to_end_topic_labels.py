@@ -11,7 +11,9 @@ from pathlib import Path
 # Add LLM Solution to path
 sys.path.insert(0, str(Path(__file__).parent / "LLM Solution"))
 
-from main_bertopic import BERTopicSentimentAnalyzer
+from main_bertopic import BERTopicSentimentAnalyzer, setup_logging
+
+setup_logging()
 
 print("=" * 80)
 print("END-TO-END TEST: Topic-Labels von mBART bis Excel")
@@ -119,6 +121,44 @@ except Exception as e:
     import traceback
     traceback.print_exc()
 
+# Test: Label-Qualität int8/bf16 vs. fp32
+print("\n" + "=" * 80)
+print("TEST 2: mBART Präzision (int8/bf16) vs. fp32 Labels")
+print("=" * 80)
+
+try:
+    import time
+    from abstractive_summarizer import AbstractiveSummarizer
+    from quantization import label_agreement
+
+    # Ein Topic pro Artikel: Titel-Wörter als Keywords, Artikel als Dokument
+    label_topics = [
+        ([(word.lower(), 1.0) for word in article["title"].split()], [article["content"]])
+        for article in test_data
+    ]
+
+    precision_labels = {}
+    for precision in ("fp32", "int8", "bf16"):
+        summarizer = AbstractiveSummarizer(precision=precision)
+        if summarizer.precision != precision:
+            print(f"   ⚠️  {precision} nicht verfügbar (verwendet: {summarizer.precision}) - übersprungen")
+            continue
+        start = time.time()
+        precision_labels[precision] = summarizer.generate_topic_labels_batch(label_topics)
+        print(f"   {precision}: {time.time() - start:.2f}s → {precision_labels[precision]}")
+        del summarizer
+
+    for precision, labels in precision_labels.items():
+        if precision != "fp32":
+            agreement = label_agreement(precision_labels["fp32"], labels)
+            status = "✓" if agreement >= 0.9 else "⚠️ "
+            print(f"   {status} {precision} vs. fp32: {agreement:.0%} identische Labels")
+
+except Exception as e:
+    print(f"\n❌ FEHLER: {e}")
+    import traceback
+    traceback.print_exc()
+
 # Cleanup
 print("\n" + "=" * 80)
 print("CLEANUP:")